@@ -6,14 +6,7 @@ import os
 import re
 import time
 import json
-import glob
-import shutil
 import subprocess
-import signal
-import math
-import urllib.request
-import urllib.error
-import base64
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QDoubleSpinBox, QComboBox, QPushButton, QTextEdit,
@@ -26,30 +19,69 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     QThread, pyqtSignal, QRegularExpression, Qt, QSize, QRect,
-    QTimer, QMimeData, QPointF, QRectF,
+    QTimer, QMimeData, QPointF, QRectF, QEvent, QByteArray, QSignalBlocker,
+    QUrl, QObject, QRunnable, QThreadPool, QProcess, QFileSystemWatcher,
 )
 from PyQt6.QtGui import (
     QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QPainter, QDrag,
     QPen, QBrush, QPolygonF, QTextCursor, QPainterPath, QPixmap, QIcon,
+    QDesktopServices,
 )
 
 try:
     import serial
-    import serial.tools.list_ports
     _SERIAL_AVAILABLE = True
 except ImportError:
     _SERIAL_AVAILABLE = False
+# serial.tools.list_ports pulls in every platform backend — imported lazily
+# in _scan_usb_ports so startup doesn't pay for it
 
 # --- Configuration ---
 _PKG_DIR = os.path.dirname(os.path.abspath(__file__))
 _GIT_CREDS_FILE = os.path.join(_PKG_DIR, ".git_credentials.json")
 
+# Entries _git_init guarantees are present in .gitignore (local config
+# and caches that must never reach GitHub)
+_GITIGNORE_ENTRIES = (".git_credentials.json", ".git_credentials.*.tmp",
+                      ".robot_profiles.json", ".node_canvas.json",
+                      "__pycache__/", "*.pyc")
+
 # Arduino-cli executable — full path so it works when launched outside a terminal
 ARDUINO_CLI = os.path.expanduser("~/.local/bin/arduino-cli")
 # Board FQBN for Wheeltec MiniBalance Duino (ATmega328P, UNO-compatible, CH340)
 CODEBOT_FQBN = "arduino:avr:uno"
 # Default baud rate for serial communication with Codebot Air
 CODEBOT_BAUD = 115200
+# USB vendor IDs of the Codebot Air's serial chip (WCH / CH340)
+CODEBOT_VIDS = frozenset({0x1A86})
+
+# Compiled-sketch cache, keyed by a hash of the sources — lets Run skip
+# straight to upload when nothing changed since the last compile
+_BIN_CACHE_DIR = os.path.expanduser("~/.cache/codebotair")
+
+
+def _sketch_hash():
+    """Fingerprint of the sketch sources (.ino/.h/.cpp), or None on error."""
+    import hashlib
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        names = sorted(n for n in os.listdir(_PKG_DIR)
+                       if n.endswith(('.ino', '.h', '.cpp')))
+        for name in names:
+            h.update(name.encode())
+            with open(os.path.join(_PKG_DIR, name), 'rb') as fh:
+                while True:
+                    chunk = fh.read(65536)
+                    if not chunk:
+                        break
+                    h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+# Skip syntax highlighting for files larger than this (QSyntaxHighlighter
+# rescans every block and becomes sluggish past a few hundred KB)
+_HIGHLIGHT_MAX_BYTES = 262144
 
 # Files to show in Full View (relative to _PKG_DIR)
 _FULL_VIEW_FILES = [
@@ -61,9 +93,347 @@ _FULL_VIEW_FILES = [
 _PROTECTED_FV_FOLDERS = {"roboapps"}
 _PROTECTED_FV_FILES = {"codebotair.py"}
 
+# Directories to hide from the Full View file tree: exact names as a
+# frozenset membership test, suffixes as one C-level endswith call
+_FV_HIDDEN_EXACT = frozenset({"__pycache__", ".git", "resource", "msg", "srv"})
+_FV_HIDDEN_SUFFIX = (".egg-info",)
+
+# Parameter sync patterns, compiled once — these run on every spinbox tick
+# and editor keystroke. The write side is one alternation over all seven
+# assignments so a sync makes a single pass over the buffer instead of
+# seven; group names match the spinbox attributes that own the values.
+_PARAM_UNION_RE = re.compile(
+    r'(?P<forward_speed>self\.forward_speed\s*=\s*)[\d.]+'
+    r'|(?P<backward_speed>self\.backward_speed\s*=\s*)[\d.]+'
+    r'|(?P<turn_speed>self\.turn_speed\s*=\s*)[\d.]+'
+    r'|(?P<obstacle_distance>self\.obstacle_distance\s*=\s*)[\d.]+'
+    r'|(?P<turn_cw>self\.turn_cw_deg\s*=\s*)[\d.]+'
+    r'|(?P<turn_acw>self\.turn_acw_deg\s*=\s*)[\d.]+'
+    r'|(?P<colour>self\.colour_detection\s*=\s*")[^"]*"'
+)
+_PARAM_FMTS = {
+    'forward_speed': '{:.2f}', 'backward_speed': '{:.2f}',
+    'turn_speed': '{:.2f}', 'obstacle_distance': '{:.2f}',
+    'turn_cw': '{:.1f}', 'turn_acw': '{:.1f}',
+}
+
+_PARAM_READ_SPECS = (
+    (re.compile(r'self\.forward_speed\s*=\s*([\d.]+)'), 'forward_speed'),
+    (re.compile(r'self\.backward_speed\s*=\s*([\d.]+)'), 'backward_speed'),
+    (re.compile(r'self\.turn_speed\s*=\s*([\d.]+)'), 'turn_speed'),
+    (re.compile(r'self\.obstacle_distance\s*=\s*([\d.]+)'), 'obstacle_distance'),
+    (re.compile(r'self\.turn_cw_deg\s*=\s*([\d.]+)'), 'turn_cw'),
+    (re.compile(r'self\.turn_acw_deg\s*=\s*([\d.]+)'), 'turn_acw'),
+)
+_COLOUR_READ_RE = re.compile(r'self\.colour_detection\s*=\s*"([^"]+)"')
+
+# Push-dialog branch choices; the index dict gives O(1) saved-branch lookup
+_BRANCHES = ("main", "windows", "roboapps")
+_BRANCH_IDX = {b: i for i, b in enumerate(_BRANCHES)}
+
 # Path to movement.py (retained for editor compatibility; may not exist in Codebot Air)
 MOVEMENT_PY = os.path.join(_PKG_DIR, "movement_pkg", "movement.py")
 
+# RoboApps folder — joined once at import, reused by all callers
+_ROBOAPPS_DIR = os.path.join(_PKG_DIR, "roboapps")
+
+
+def _refill(combo, items):
+    """Replace a combo box's items in one batch.
+
+    Blocks signals on the combo and its model for the clear + addItems so
+    neither per-row insert signals nor spurious currentTextChanged slots
+    fire, then emits a single layoutChanged so the view refreshes once.
+    """
+    combo.blockSignals(True)
+    model = combo.model()
+    model.blockSignals(True)
+    combo.clear()
+    combo.addItems(items)
+    model.blockSignals(False)
+    combo.blockSignals(False)
+    model.layoutChanged.emit()
+
+
+def _scan_project_files():
+    """Walk the project directory and return the Full View tree contents.
+
+    Pure disk work — no Qt widgets — so it can run on a worker thread.
+    Returns an ordered list of ('dir', dir_name) and
+    ('file', dir_name_or_None, file_name, rel_path) tuples.
+    """
+    entries = []
+    seen_files = set()
+    seen_dirs = set()
+
+    def _add_dir(dir_name):
+        if dir_name not in seen_dirs:
+            seen_dirs.add(dir_name)
+            entries.append(('dir', dir_name))
+
+    def _add_file(dir_name, file_name, rel_path):
+        if rel_path not in seen_files:
+            seen_files.add(rel_path)
+            entries.append(('file', dir_name, file_name, rel_path))
+
+    # 1) Static files from _FULL_VIEW_FILES
+    for rel_path in _FULL_VIEW_FILES:
+        if not os.path.isfile(os.path.join(_PKG_DIR, rel_path)):
+            continue
+        dir_name = os.path.dirname(rel_path)
+        if dir_name:
+            _add_dir(dir_name)
+        _add_file(dir_name or None, os.path.basename(rel_path), rel_path)
+
+    # 2) One scandir pass over the project root — DirEntry caches the type
+    # (no stat per name), and a single loop handles subdirectories and
+    # root-level files alike
+    with os.scandir(_PKG_DIR) as it:
+        root_entries = sorted(it, key=lambda e: e.name)
+
+    for entry in root_entries:
+        name = entry.name
+        if name.startswith("."):
+            continue
+        if entry.is_dir():
+            if name.startswith("__"):
+                continue
+            if name in _FV_HIDDEN_EXACT or name.endswith(_FV_HIDDEN_SUFFIX):
+                continue
+            _add_dir(name)
+            with os.scandir(entry.path) as sub:
+                for fentry in sorted(sub, key=lambda e: e.name):
+                    if fentry.is_file():
+                        _add_file(name, fentry.name,
+                                  os.path.join(name, fentry.name))
+        elif entry.is_file():
+            _add_file(None, name, name)
+
+    return entries
+
+
+# Headers common to all GitHub API requests
+_HTTP_HEADERS = {
+    "Accept":     "application/vnd.github+json",
+    "User-Agent": "codebotair/1.0",
+}
+
+
+# GitHub repo URL parsers, shared by push/pull/auth validation
+_GH_URL_RE = re.compile(r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$')
+_GH_USER_RE = re.compile(r'https://github\.com/([^/]+)')
+
+# Credentials embedded in a remote URL (user:token@host) — git quotes the
+# full URL in its error output, so anything logged must pass through here
+_TOKEN_URL_RE = re.compile(r'://([^/:@\s]+):[^@\s]+@')
+
+
+def _mask_token(text):
+    """Blank out embedded URL credentials before text reaches the log."""
+    return _TOKEN_URL_RE.sub(r'://\1:***@', text)
+
+# Auth/repo-metadata validation results keyed by (repo_url, token-hash).
+# Short TTL so repeat pushes in one session skip the API round-trip; only
+# a SHA-256 of the token is kept, never the token itself.
+_AUTH_CACHE = {}
+_AUTH_CACHE_TTL = 300.0  # seconds
+
+
+def _auth_cache_key(repo_url, token):
+    import hashlib
+    return (repo_url, hashlib.sha256(token.encode()).hexdigest())
+
+
+def _cached_github_auth(repo_url, token):
+    """Return fresh cached auth metadata for the URL+token pair, or None."""
+    ts, meta = _AUTH_CACHE.get(_auth_cache_key(repo_url, token), (0.0, None))
+    if time.time() - ts < _AUTH_CACHE_TTL:
+        return meta
+    return None
+
+
+def _store_github_auth(repo_url, token, info):
+    """Cache repo metadata from a successful /repos/:owner/:repo reply."""
+    meta = {
+        "validated_at":   time.time(),
+        "default_branch": info.get("default_branch", "main"),
+        "private":        info.get("private", False),
+    }
+    _AUTH_CACHE[_auth_cache_key(repo_url, token)] = (time.time(), meta)
+    return meta
+
+
+class _PortScanSignals(QObject):
+    done = pyqtSignal(list)
+
+
+class _PortScanner(QRunnable):
+    """Enumerates serial ports on the global thread pool.
+
+    comports() walks sysfs/IOKit/SetupAPI and can stall for tens of ms;
+    running it off the GUI thread keeps the event loop responsive.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _PortScanSignals()
+
+    def run(self):
+        import serial.tools.list_ports
+        try:
+            # grep() pattern-matches device/description/hwid in the
+            # backend, so non-matching ports skip the per-port attribute
+            # reads that dominate a full comports() walk
+            ports = list(serial.tools.list_ports.grep(r'(?i)VID:PID=1A86:|CH340'))
+        except Exception:
+            ports = []
+        self.signals.done.emit(ports)
+
+
+class _TreeScanSignals(QObject):
+    done = pyqtSignal(list)
+
+
+class _TreeScanner(QRunnable):
+    """Runs _scan_project_files on the global thread pool."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _TreeScanSignals()
+
+    def run(self):
+        try:
+            entries = _scan_project_files()
+        except OSError:
+            entries = []
+        self.signals.done.emit(entries)
+
+
+class _SerialWriter(QObject):
+    """Performs serial writes on a dedicated worker thread.
+
+    pyserial writes are blocking: a full OS buffer or a just-yanked
+    cable can stall write() for seconds, which on the GUI thread would
+    freeze the very Stop button that needs to stay responsive. Emitting
+    submit from the GUI thread queues the write over here; results come
+    back as wrote/failed signals.
+    """
+
+    submit = pyqtSignal(object, bytes, str)
+    wrote = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.submit.connect(self._do_write)
+
+    def _do_write(self, conn, payload, done_msg):
+        try:
+            conn.write(payload)
+            self.wrote.emit(done_msg)
+        except Exception as e:
+            self.failed.emit(f"Serial write ERROR: {e}")
+
+
+class _GitPipeline(QObject):
+    """Chain of git commands run one at a time via QProcess.
+
+    Steps execute sequentially on the event loop, so multi-command
+    operations (init, commit+push) no longer block the GUI between
+    commands. Each git step's handler is called with
+    (exit_code, stdout, stderr) when the command exits; a handler may
+    return False to abort the rest of the pipeline, and may queue further
+    steps with add()/add_next(). finished(success) fires exactly once,
+    with success False only when a step aborted.
+    """
+
+    finished = pyqtSignal(bool)
+
+    #: sentinel an add_call step may return to suspend the pipeline until
+    #: an external continuation (e.g. a network reply) calls resume()
+    PAUSE = object()
+
+    def __init__(self, parent, cwd=_PKG_DIR):
+        super().__init__(parent)
+        self._cwd = cwd
+        self._steps = []
+        self._done = False
+
+    def add(self, args, handler=None):
+        """Append a git step; a None handler ignores the exit status."""
+        self._steps.append((list(args), handler))
+        return self
+
+    def add_next(self, args, handler=None):
+        """Insert a git step to run immediately after the current one."""
+        self._steps.insert(0, (list(args), handler))
+        return self
+
+    def add_call(self, func):
+        """Append a plain-Python step (file writes, API calls)."""
+        self._steps.append((None, func))
+        return self
+
+    def start(self):
+        self._advance()
+
+    def resume(self):
+        """Continue after an add_call step returned PAUSE."""
+        self._advance()
+
+    def abort(self):
+        """Finish a paused pipeline without running its remaining steps."""
+        self._finish(False)
+
+    def _advance(self):
+        while self._steps:
+            args, handler = self._steps.pop(0)
+            if args is None:
+                result = handler()
+                if result is False:
+                    self._finish(False)
+                    return
+                if result is _GitPipeline.PAUSE:
+                    return
+                continue
+            proc = QProcess(self)
+            proc.setProgram("git")
+            proc.setArguments(args)
+            proc.setWorkingDirectory(self._cwd)
+
+            def _step_done(code, _status, proc=proc, handler=handler):
+                out = bytes(proc.readAllStandardOutput()).decode(errors="replace")
+                err = bytes(proc.readAllStandardError()).decode(errors="replace")
+                proc.deleteLater()
+                if handler is not None and handler(code, out, err) is False:
+                    self._finish(False)
+                    return
+                self._advance()
+
+            def _step_error(perr, proc=proc, handler=handler):
+                # finished never fires for FailedToStart (git not installed)
+                if perr != QProcess.ProcessError.FailedToStart:
+                    return
+                proc.deleteLater()
+                if handler is not None and handler(127, "", "git: failed to start") is False:
+                    self._finish(False)
+                    return
+                self._advance()
+
+            proc.finished.connect(_step_done)
+            proc.errorOccurred.connect(_step_error)
+            proc.start()
+            return
+        self._finish(True)
+
+    def _finish(self, ok):
+        if self._done:
+            return
+        self._done = True
+        self.finished.emit(ok)
+        self.deleteLater()
+
+
 # Code snippets for drag-and-drop in Simple View (8-space indent for __init__ body)
 _SIMPLE_VIEW_SNIPPETS = {
     # Control
@@ -121,6 +491,115 @@ _SIMPLE_VIEW_SNIPPETS = {
     ),
 }
 
+# Intern the snippet strings \u2014 each button keeps a reference and drags
+# re-use them, so a single shared copy per snippet is enough
+_SIMPLE_VIEW_SNIPPETS = {k: sys.intern(v) for k, v in _SIMPLE_VIEW_SNIPPETS.items()}
+
+# Simple View code template \u2014 interpolated with format_map per call instead
+# of rebuilding a ~40-line f-string every time a spinbox moves
+# Git dropdown stylesheet — shared constant so the string isn't rebuilt
+# (and re-parsed by Qt) on every click of the GitHub button
+_GIT_MENU_QSS = (
+    "QMenu { background: white; border: 1px solid #ddd; border-radius: 8px; "
+    "padding: 4px 0; font-size: 13px; }"
+    "QMenu::item { padding: 8px 24px; color: #1a1a1a; }"
+    "QMenu::item:selected { background: #F0F0F0; color: #1a1a1a; border-radius: 4px; }"
+    "QMenu::separator { height: 1px; background: #eee; margin: 4px 0; }"
+)
+
+# Application-wide stylesheet, parsed once by Qt at startup. Widgets opt in
+# via setObjectName instead of each carrying its own per-widget style copy.
+_QSS = """
+QPushButton#primaryBtn { background-color: #007AFF; color: white; padding: 8px; border-radius: 8px; }
+QPushButton#primaryBtn:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }
+QPushButton#runBtn { background-color: #34C759; color: white; padding: 8px; border-radius: 8px; font-weight: bold; }
+QPushButton#runBtn:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }
+QPushButton#stopBtn { background-color: #FF3B30; color: white; padding: 8px; border-radius: 8px; font-weight: bold; }
+QPushButton#stopBtn:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }
+QPushButton#saveBtn { background-color: #34C759; color: white; padding: 8px; border-radius: 8px; }
+QPushButton#editorSaveBtn { background-color: #34C759; color: white; padding: 6px 14px; border-radius: 8px; }
+QPushButton#editorDeployBtn { background-color: #007AFF; color: white; padding: 6px 14px; border-radius: 8px; }
+QPushButton#editorDeployBtn:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }
+QPushButton#circleBtn, QPushButton#circleBtnSmall, QPushButton#circleBtnLarge {
+    font-size: 20px; font-weight: bold;
+    min-width: 36px; max-width: 36px;
+    min-height: 36px; max-height: 36px; border-radius: 18px;
+    background-color: #007AFF; color: white;
+    border: 2px solid #005ECB;
+}
+QPushButton#circleBtn:hover, QPushButton#circleBtnSmall:hover, QPushButton#circleBtnLarge:hover { background-color: #005ECB; }
+QPushButton#circleBtnSmall { font-size: 14px; }
+QPushButton#circleBtnLarge { font-size: 20px; }
+QPushButton#circleDeleteBtn {
+    font-size: 20px; font-weight: bold;
+    min-width: 36px; max-width: 36px;
+    min-height: 36px; max-height: 36px; border-radius: 18px;
+    background-color: #FF3B30; color: white;
+    border: 2px solid #CC2A22;
+}
+QPushButton#circleDeleteBtn:hover { background-color: #CC2A22; }
+QPushButton#circleDeleteBtn:checked { background-color: #CC2A22; border: 2px solid #FFFFFF; }
+QPushButton#viewToggleBtn { border: none; padding: 6px 16px; border-radius: 8px; color: white; background: #8E8E93; font-size: 13px; }
+QPushButton#viewToggleBtn:checked { background: #007AFF; }
+QPushButton#roundIconBtn, QPushButton#supportBtn { background-color: white; border-radius: 18px; border: 1px solid #CCCCCC; }
+QPushButton#roundIconBtn:hover, QPushButton#supportBtn:hover { background-color: #F0F0F0; }
+QPushButton#supportBtn { color: #333333; font-size: 16px; font-weight: bold; }
+QPushButton#appIconBtn { background-color: #007AFF; color: white; font-size: 16px; font-weight: bold; border-radius: 27px; border: none; }
+QPushButton#appIconBtn:hover { background-color: #005ECB; }
+QPushButton#appIconBtn:pressed { background-color: #004AAD; }
+"""
+
+# Matches numeric parameter assignments in movement.py
+_PARAM_RE = re.compile(r'self\.(\w+)\s*=\s*([-\d.]+)')
+
+# Marker-bounded control_loop section of movement.py. One compiled pattern
+# serves both the splice (sub) and the extraction (search, group 2) in a
+# single pass over the file text.
+_LOGIC_SPLICE_RE = re.compile(
+    r'(        # user control_loop logic below\n)'
+    r'(.*?)'
+    r'(        # end user control_loop logic)',
+    re.DOTALL)
+
+
+# Everything after the Movement Logic banner line in Simple View code
+_LOGIC_EXTRACT_RE = re.compile(r'# === Movement Logic ===.*?\n(.*)\Z', re.DOTALL)
+
+
+def _apply_logic_splice(code, logic):
+    """Replace the marker-bounded control_loop section of *code* with *logic*.
+
+    Returns *code* unchanged when the markers are missing.
+    """
+    return _LOGIC_SPLICE_RE.sub(
+        lambda m: m.group(1) + logic + '\n' + m.group(3), code, count=1)
+
+_SIMPLE_CODE_TEMPLATE = (
+    'from codebotair import Robot\n'
+    '\n'
+    'class Movement(Robot):\n'
+    '    def __init__(self):\n'
+    '        super().__init__()\n'
+    '        # === Editable Parameters ===\n'
+    '        self.forward_speed = {fwd:.2f}       # m/s  \u2190 edit\n'
+    '        self.backward_speed = {bwd:.2f}      # m/s  \u2190 edit\n'
+    '        self.turn_speed = {turn:.2f}          # rad/s  \u2190 edit\n'
+    '        self.obstacle_distance = {obs:.2f}   # metres  \u2190 edit\n'
+    '        self.turn_cw_deg = {cw:.1f}         # degrees CW  \u2190 edit\n'
+    '        self.turn_acw_deg = {acw:.1f}        # degrees ACW  \u2190 edit\n'
+    '        self.colour_detection = "{colour}"   # Red|Blue|Yellow|Green  \u2190 edit\n'
+    '\n'
+    '    # vvv Drag and drop functions below vvv\n'
+    '\n'
+    '    def control_loop(self):\n'
+    '        # === Movement Logic ===\n'
+    '        if self.obstacle_in_front():\n'
+    '            self.stop()                       # stop movement\n'
+    '            self.turn_cw(self.turn_cw_deg)    # turn clockwise  \u2190 edit\n'
+    '        else:\n'
+    '            self.move(self.forward_speed)     # drive forward  \u2190 edit\n'
+)
+
 
 
 # --- Drag-and-drop function buttons for Simple View ---
@@ -131,6 +610,8 @@ class DraggableFunctionButton(QPushButton):
     def __init__(self, label, code_snippet, parent=None):
         super().__init__(label, parent)
         self._code_snippet = code_snippet
+        # Pre-encode the drag payload once instead of on every drag
+        self._mime_bytes = QByteArray(code_snippet.encode('utf-8'))
         self._drag_start_pos = None
         self.setCursor(Qt.CursorShape.OpenHandCursor)
         self.setStyleSheet(
@@ -154,7 +635,7 @@ class DraggableFunctionButton(QPushButton):
             if distance >= QApplication.startDragDistance():
                 drag = QDrag(self)
                 mime = QMimeData()
-                mime.setText(self._code_snippet)
+                mime.setData("text/plain", self._mime_bytes)
                 drag.setMimeData(mime)
                 drag.exec(Qt.DropAction.CopyAction)
                 self._drag_start_pos = None
@@ -233,22 +714,58 @@ class LineNumberEditor(QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._line_area = _LineNumberArea(self)
+        # Cache font metrics — querying them per painted line while
+        # scrolling is a known gutter bottleneck.
+        self._cache_font_metrics()
+        self._area_w_digits = 0
+        self._area_w = 0
+        self._last_gutter_y = -1
+        self._last_gutter_h = -1
         self.blockCountChanged.connect(self._update_line_area_width)
         self.updateRequest.connect(self._update_line_area)
         self.cursorPositionChanged.connect(self._line_area.update)
         self._update_line_area_width()
 
+    def _cache_font_metrics(self):
+        fm = self.fontMetrics()
+        self._digit_w = fm.horizontalAdvance('9')
+        self._line_h = fm.height()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._cache_font_metrics()
+            self._area_w_digits = 0  # force width recompute
+            self._update_line_area_width()
+
     def _line_area_width(self):
         digits = max(1, len(str(self.blockCount())))
-        return int(1.5 * (10 + self.fontMetrics().horizontalAdvance('9') * digits))
+        # Only recompute when the digit count changes (10 → 100 → 1000 ...)
+        if digits != self._area_w_digits:
+            self._area_w_digits = digits
+            self._area_w = int(1.5 * (10 + self._digit_w * digits))
+        return self._area_w
 
     def _update_line_area_width(self, _=0):
+        # blockCountChanged fires per line while populating a big document;
+        # the gutter only widens when the line count gains a digit, and
+        # setViewportMargins triggers a viewport relayout — skip otherwise.
+        if max(1, len(str(self.blockCount()))) == self._area_w_digits:
+            return
         self.setViewportMargins(self._line_area_width(), 0, 0, 0)
 
     def _update_line_area(self, rect, dy):
+        if rect.width() <= 0:
+            return
         if dy:
             self._line_area.scroll(0, dy)
-        else:
+            self._last_gutter_y = -1  # scrolled — next update must repaint
+        elif (rect.y() != self._last_gutter_y
+                or rect.height() != self._last_gutter_h):
+            # Only repaint when the dirty span actually changed — Qt emits
+            # updateRequest for cursor blinks etc. that don't touch the gutter
+            self._last_gutter_y = rect.y()
+            self._last_gutter_h = rect.height()
             self._line_area.update(0, rect.y(), self._line_area.width(), rect.height())
         if rect.contains(self.viewport().rect()):
             self._update_line_area_width()
@@ -275,7 +792,7 @@ class LineNumberEditor(QPlainTextEdit):
                 if block_number == current_block_number:
                     painter.fillRect(
                         0, top, self._line_area.width(),
-                        self.fontMetrics().height(), QColor("#D0D0FF"),
+                        self._line_h, QColor("#D0D0FF"),
                     )
                     painter.setPen(QColor("#0000CC"))
                 else:
@@ -283,7 +800,7 @@ class LineNumberEditor(QPlainTextEdit):
                 painter.drawText(
                     0, top,
                     self._line_area.width(),
-                    self.fontMetrics().height(),
+                    self._line_h,
                     Qt.AlignmentFlag.AlignCenter,
                     str(block_number + 1),
                 )
@@ -297,12 +814,30 @@ class LineNumberEditor(QPlainTextEdit):
 class SimpleViewEditor(LineNumberEditor):
     """Editor for Simple View — only allows drops inside the control_loop section."""
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Cache the control_loop line — dragMoveEvent fires many times per
+        # second and rescanning the whole document each time causes lag.
+        self._logic_line_cache = None
+        self.textChanged.connect(self._invalidate_logic_line_cache)
+
+    def _invalidate_logic_line_cache(self):
+        self._logic_line_cache = None
+
     def _logic_start_line(self):
         """Return the line number of 'def control_loop', or None."""
-        for i, line in enumerate(self.toPlainText().split('\n')):
-            if 'def control_loop' in line:
-                return i
-        return None
+        if self._logic_line_cache is None:
+            # Walk the document blocks — avoids copying the whole document
+            # out via toPlainText() just to split it into lines.
+            line = -1
+            block = self.document().firstBlock()
+            while block.isValid():
+                if 'def control_loop' in block.text():
+                    line = block.blockNumber()
+                    break
+                block = block.next()
+            self._logic_line_cache = line
+        return self._logic_line_cache if self._logic_line_cache >= 0 else None
 
     def dragEnterEvent(self, event):
         """Accept drag so the cursor tracks, but actual gating is in dropEvent."""
@@ -367,8 +902,25 @@ class SimpleCodeHighlighter(QSyntaxHighlighter):
         self._drop_guide_fmt.setForeground(QColor("#FF0000"))
         self._drop_guide_fmt.setFontWeight(QFont.Weight.Bold)
 
+        # Rule table built once: (gate substring, regex, format, capture
+        # group, trailing chars to drop). QRegularExpression (PCRE2 + JIT)
+        # is faster than Python `re` on the short strings highlightBlock
+        # sees on every keystroke; the gate skips regexes that cannot match.
+        self._rules = (
+            (None, QRegularExpression(r'\b(?:import|from|class|def|super)\b'),
+             self._keyword_fmt, 0, 0),
+            ('self.', QRegularExpression(r'self\.(\w+)\s*='),
+             self._self_fmt, 0, 1),
+            ('=', QRegularExpression(r'=\s*([\d.]+)'),
+             self._value_fmt, 1, 0),
+            ('"', QRegularExpression(r'"([^"]*)"'),
+             self._string_fmt, 0, 0),
+        )
+
     def highlightBlock(self, text):
         stripped = text.lstrip()
+        if not stripped:
+            return  # blank line — nothing to highlight
 
         # Full-line comments
         if stripped.startswith('#'):
@@ -379,22 +931,15 @@ class SimpleCodeHighlighter(QSyntaxHighlighter):
                 self.setFormat(0, len(text), self._comment_fmt)
             return
 
-        # Python keywords
-        for kw in ['import', 'from', 'class', 'def', 'super']:
-            for m in re.finditer(rf'\b{kw}\b', text):
-                self.setFormat(m.start(), len(m.group()), self._keyword_fmt)
-
-        # self.param_name (before =)
-        for m in re.finditer(r'self\.(\w+)\s*=', text):
-            self.setFormat(m.start(), len(m.group()) - 1, self._self_fmt)
-
-        # Numeric values after =
-        for m in re.finditer(r'=\s*([\d.]+)', text):
-            self.setFormat(m.start(1), len(m.group(1)), self._value_fmt)
-
-        # Quoted strings
-        for m in re.finditer(r'"([^"]*)"', text):
-            self.setFormat(m.start(), len(m.group()), self._string_fmt)
+        # Keywords / self.param / numeric values / quoted strings
+        for gate, rx, fmt, group, trim in self._rules:
+            if gate is not None and gate not in text:
+                continue
+            it = rx.globalMatch(text)
+            while it.hasNext():
+                m = it.next()
+                self.setFormat(
+                    m.capturedStart(group), m.capturedLength(group) - trim, fmt)
 
         # Inline comments
         idx = text.find('#')
@@ -418,6 +963,10 @@ class FullViewHighlighter(QSyntaxHighlighter):
         "customize main function below", "end main customization",
         "note: editing any of the generated code",
     ]
+    # One alternation instead of a Python loop of substring scans per line;
+    # IGNORECASE so the comment text never needs lowercasing first
+    _WARN_RE = re.compile(
+        '|'.join(re.escape(p) for p in _WARNING_PATTERNS), re.IGNORECASE)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -428,21 +977,18 @@ class FullViewHighlighter(QSyntaxHighlighter):
         self._warning_fmt.setForeground(QColor("#D32F2F"))  # red
 
     def highlightBlock(self, text):
+        if '#' not in text:
+            return  # no comment — nothing to highlight
         stripped = text.lstrip()
         if stripped.startswith('#'):
-            idx = text.index('#')
-            comment_text = text[idx:]
+            idx = len(text) - len(stripped)
         else:
             idx = text.find('#')
-            if idx < 0:
-                return
-            comment_text = text[idx:]
+        comment_text = text[idx:]
 
-        lower = comment_text.lower()
-        for pat in self._WARNING_PATTERNS:
-            if pat in lower:
-                self.setFormat(idx, len(text) - idx, self._warning_fmt)
-                return
+        if self._WARN_RE.search(comment_text):
+            self.setFormat(idx, len(text) - idx, self._warning_fmt)
+            return
 
         self.setFormat(idx, len(text) - idx, self._comment_fmt)
 
@@ -493,20 +1039,72 @@ class CodeEditorDialog(QDialog):
         self._editor = LineNumberEditor()
         self._editor.setFont(QFont("Menlo", 12))
         self._editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-        self._highlighter = FullViewHighlighter(self._editor.document())
+        self._highlighter = None
         layout.addWidget(self._editor)
 
-        # Load file + jump to search_text
+        # Load file + jump to search_text. Binary read + one decode avoids
+        # text-mode newline translation and chunked decoding; above 1MB go
+        # through mmap so the read skips the userland buffer copy.
         try:
-            with open(file_path, "r") as f:
-                self._editor.setPlainText(f.read())
+            nbytes = os.path.getsize(file_path)
+            if nbytes > 1_048_576:
+                import mmap
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                    try:
+                        content = mm[:].decode("utf-8", "replace")
+                    finally:
+                        mm.close()
+                finally:
+                    os.close(fd)
+            else:
+                with open(file_path, "rb") as f:
+                    content = f.read().decode("utf-8", errors="replace")
         except Exception as e:
-            self._editor.setPlainText(f"# Error loading file: {e}")
+            content = f"# Error loading file: {e}"
+            nbytes = 0
+        # Large-buffer hints: no centre-on-scroll relayouts, and skip the
+        # per-edit undo-stack snapshots on multi-megabyte buffers
+        self._editor.setCenterOnScroll(False)
+        self._editor.document().setMaximumBlockCount(0)
+        self._editor.document().setUndoRedoEnabled(nbytes < 2_000_000)
+        self._editor.setPlainText(content)
+
+        # Size-gate the highlighter: attaching it rehighlights the whole
+        # document, which stalls the UI on multi-megabyte files. Even when
+        # attached, defer it one event-loop tick so the dialog paints plain
+        # text first and the highlight pass doesn't block the initial show.
+        if nbytes <= _HIGHLIGHT_MAX_BYTES:
+            QTimer.singleShot(0, self._attach_highlighter)
+        else:
+            self._highlight_btn = QPushButton(
+                "Highlighting disabled (large file) — click to enable")
+            self._highlight_btn.setStyleSheet(
+                "QPushButton { padding: 4px 12px; border-radius: 6px; "
+                "border: 1px solid #ccc; color: #666; font-size: 11px; }")
+            self._highlight_btn.clicked.connect(self._on_enable_highlighting)
+            layout.addWidget(self._highlight_btn)
+
         if search_text:
-            cursor = self._editor.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            self._editor.setTextCursor(cursor)
-            self._editor.find(search_text)
+            def _jump_to_search():
+                cursor = self._editor.textCursor()
+                cursor.movePosition(cursor.MoveOperation.Start)
+                self._editor.setTextCursor(cursor)
+                self._editor.find(search_text)
+            if nbytes > 2_000_000:
+                # Let the initial paint finish before searching a huge file
+                QTimer.singleShot(0, _jump_to_search)
+            else:
+                _jump_to_search()
+
+    def _attach_highlighter(self):
+        if self._highlighter is None:
+            self._highlighter = FullViewHighlighter(self._editor.document())
+
+    def _on_enable_highlighting(self):
+        self._attach_highlighter()
+        self._highlight_btn.hide()
 
     def _save(self):
         try:
@@ -531,8 +1129,8 @@ class CodeEditorDialog(QDialog):
     def content(self):       return self._editor.toPlainText()
 
 
-def _make_github_icon(size=20, color="#333333"):
-    """Return a QIcon containing the GitHub Invertocat mark rendered at *size*×*size*."""
+def _parse_github_ops():
+    """Tokenize the GitHub mark SVG path into absolute (cmd, *coords) tuples."""
     # GitHub mark SVG path (24×24 viewBox, MIT-licensed mark)
     SVG_D = (
         "M12 .297c-6.63 0-12 5.373-12 12 0 5.303 3.438 9.8 8.205 11.385"
@@ -550,8 +1148,8 @@ def _make_github_icon(size=20, color="#333333"):
         "c0-6.627-5.373-12-12-12"
     )
 
-    # Parse SVG path into QPainterPath
-    path = QPainterPath()
+    # Tokenize the path string into absolute drawing ops
+    ops = []
     tokens = re.findall(
         r'[MmCcLlZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?', SVG_D)
     i = 0
@@ -566,36 +1164,78 @@ def _make_github_icon(size=20, color="#333333"):
         if tokens[i] in 'MmCcLlZz':
             cmd = tokens[i]; i += 1; continue
         if cmd == 'M':
-            x, y = nf(), nf(); path.moveTo(x, y); cx = x; cy = y; sx = x; sy = y; cmd = 'L'
+            x, y = nf(), nf(); ops.append(('M', x, y)); cx = x; cy = y; sx = x; sy = y; cmd = 'L'
         elif cmd == 'm':
-            x = cx + nf(); y = cy + nf(); path.moveTo(x, y); cx = x; cy = y; sx = x; sy = y; cmd = 'l'
+            x = cx + nf(); y = cy + nf(); ops.append(('M', x, y)); cx = x; cy = y; sx = x; sy = y; cmd = 'l'
         elif cmd == 'L':
-            x, y = nf(), nf(); path.lineTo(x, y); cx = x; cy = y
+            x, y = nf(), nf(); ops.append(('L', x, y)); cx = x; cy = y
         elif cmd == 'l':
-            x = cx + nf(); y = cy + nf(); path.lineTo(x, y); cx = x; cy = y
+            x = cx + nf(); y = cy + nf(); ops.append(('L', x, y)); cx = x; cy = y
         elif cmd == 'C':
             x1, y1, x2, y2, x, y = nf(), nf(), nf(), nf(), nf(), nf()
-            path.cubicTo(x1, y1, x2, y2, x, y); cx = x; cy = y
+            ops.append(('C', x1, y1, x2, y2, x, y)); cx = x; cy = y
         elif cmd == 'c':
             x1 = cx + nf(); y1 = cy + nf()
             x2 = cx + nf(); y2 = cy + nf()
             x  = cx + nf(); y  = cy + nf()
-            path.cubicTo(x1, y1, x2, y2, x, y); cx = x; cy = y
+            ops.append(('C', x1, y1, x2, y2, x, y)); cx = x; cy = y
         elif cmd in 'Zz':
-            path.closeSubpath(); cx = sx; cy = sy; cmd = None
+            ops.append(('Z',)); cx = sx; cy = sy; cmd = None
         else:
             i += 1
 
-    # Render path into a QPixmap
+    return ops
+
+
+def _build_github_path():
+    """Build a QPainterPath from the cached op tuples — no string parsing."""
+    global _GITHUB_OPS
+    if _GITHUB_OPS is None:
+        _GITHUB_OPS = _parse_github_ops()
+    path = QPainterPath()
+    for op in _GITHUB_OPS:
+        c = op[0]
+        if c == 'M':
+            path.moveTo(op[1], op[2])
+        elif c == 'L':
+            path.lineTo(op[1], op[2])
+        elif c == 'C':
+            path.cubicTo(op[1], op[2], op[3], op[4], op[5], op[6])
+        else:
+            path.closeSubpath()
+    return path
+
+
+# The path only needs parsing once — size/colour vary at render time.
+# Parsed lazily on first render so cold startup skips the tokenizer too.
+_GITHUB_OPS = None
+_GITHUB_PATH = None
+_GITHUB_ICON_CACHE = {}
+
+
+def _make_github_icon(size=20, color="#333333"):
+    """Return a QIcon containing the GitHub Invertocat mark rendered at *size*×*size*."""
+    key = (size, color)
+    icon = _GITHUB_ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+
+    global _GITHUB_PATH
+    if _GITHUB_PATH is None:
+        _GITHUB_PATH = _build_github_path()
+
+    # Render the cached path into a QPixmap
     px = QPixmap(size, size)
     px.fill(Qt.GlobalColor.transparent)
     painter = QPainter(px)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     scale = size / 24.0
     painter.scale(scale, scale)
-    painter.fillPath(path, QBrush(QColor(color)))
+    painter.fillPath(_GITHUB_PATH, QBrush(QColor(color)))
     painter.end()
-    return QIcon(px)
+    icon = QIcon(px)
+    _GITHUB_ICON_CACHE[key] = icon
+    return icon
 
 
 class GitHubButton(QPushButton):
@@ -607,11 +1247,7 @@ class GitHubButton(QPushButton):
         self.setIcon(_make_github_icon(20, "#333333"))
         self.setIconSize(QSize(20, 20))
         self.setToolTip("Git / GitHub")
-        self.setStyleSheet(
-            "QPushButton { background-color: white; border-radius: 18px; "
-            "border: 1px solid #CCCCCC; }"
-            "QPushButton:hover { background-color: #F0F0F0; }"
-        )
+        self.setObjectName("roundIconBtn")
 
 
 # ---------------------------------------------------------------------------
@@ -800,10 +1436,9 @@ class GitPushDialog(QDialog):
         pat_row.addWidget(pat_help)
 
         self._branch = QComboBox()
-        self._branch.addItems(["main", "windows", "roboapps"])
+        self._branch.addItems(_BRANCHES)
         saved_branch = creds.get("branch", "main")
-        idx = self._branch.findText(saved_branch)
-        self._branch.setCurrentIndex(idx if idx >= 0 else 0)
+        self._branch.setCurrentIndex(_BRANCH_IDX.get(saved_branch, 0))
 
         form.addRow("Commit Message:", self._msg)
         form.addRow("GitHub Repository:", self._repo_url)
@@ -855,18 +1490,67 @@ class GitPushDialog(QDialog):
 # --- Main window ---
 
 class RobotControlApp(QMainWindow):
+    # Emitted by platform hotplug callbacks (may fire off the GUI thread)
+    _usb_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Codebot Air")
         self.setMinimumWidth(600)
         self._workers = []
         self._serial_conn = None
+        self._serial_writer = None         # _SerialWriter on its own thread
+        self._serial_writer_thread = None
         self._usb_port = None
         self._known_ports = None  # None = first scan not yet done; skip auto-connect
-        self._syncing = False
+        self._port_snapshot = None  # (device, description, serial) tuples of last scan
+        self._port_scanner = None   # in-flight _PortScanner, guards overlapping scans
+        self._pending_ports = None  # changed snapshot awaiting confirmation rescan
         self._full_view_current_file = None
         self._fv_edit_mode = False
-        self._blocking_item_changed = False
+        self._tree_scanner = None
+        self._tree_folders = None   # dir_name -> item after first populate
+        self._tree_files = None     # rel_path -> item after first populate
+        self._tree_delete_on = None
+        self._fs_watcher = None
+        self._robosim_proc = None
+        self._arduino_proc = None
+        self._usb_poll_paused = False  # poll timer stopped for an upload
+        self._connecting = False
+        self._git_pipeline = None
+        self._git_creds_cache = None  # parsed .git_credentials.json
+        self._net_manager = None  # lazily-created QNetworkAccessManager
+        self._log_buf = []
+        self._log_flush = QTimer(self)
+        self._log_flush.setSingleShot(True)
+        self._log_flush.setInterval(30)
+        self._log_flush.timeout.connect(self._flush_log)
+        self._conda_env_cache = None  # (prefix, None) after first success
+        self._simple_code_key = None
+        self._simple_code_cache = ''
+        self._dirty_simple = False
+        self._dirty_full = False
+        self._params_dirty = False  # spinbox values not yet in movement.py
+        self._mv_cache = (None, None)  # (st_mtime_ns, text) of movement.py
+        # Existence checked once, not per sync tick — refreshed whenever the
+        # file tree rebuilds (add/delete/rename all funnel through it)
+        self._movement_py_exists = os.path.isfile(MOVEMENT_PY)
+        self._file_cache = {}  # rel_path -> (st_mtime_ns, text), last 8 files
+
+        # Debounces bursts of spinbox valueChanged signals (arrow-key holds,
+        # programmatic resets) into one editor sync per pause
+        self._sync_pending = QTimer(self)
+        self._sync_pending.setSingleShot(True)
+        self._sync_pending.setInterval(120)
+        self._sync_pending.timeout.connect(
+            self._sync_simple_view_from_spinboxes_impl)
+
+        # Same idea for the editor→spinbox direction: parse the Simple View
+        # text once per typing pause instead of on every keystroke
+        self._parse_pending = QTimer(self)
+        self._parse_pending.setSingleShot(True)
+        self._parse_pending.setInterval(120)
+        self._parse_pending.timeout.connect(self._on_simple_code_changed)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -883,12 +1567,7 @@ class RobotControlApp(QMainWindow):
 
         self.support_btn = QPushButton("?")
         self.support_btn.setFixedSize(36, 36)
-        self.support_btn.setStyleSheet(
-            "QPushButton { background-color: white; color: #333333; "
-            "border-radius: 18px; border: 1px solid #CCCCCC; "
-            "font-size: 16px; font-weight: bold; }"
-            "QPushButton:hover { background-color: #F0F0F0; }"
-        )
+        self.support_btn.setObjectName("supportBtn")
         self.support_btn.setToolTip("Contact Support")
         self.support_btn.clicked.connect(self._show_support_dialog)
         header_row.addWidget(self.support_btn)
@@ -897,11 +1576,7 @@ class RobotControlApp(QMainWindow):
 
         self.run_btn = QPushButton("Run")
         self.run_btn.setFixedWidth(90)
-        self.run_btn.setStyleSheet(
-            "QPushButton { background-color: #34C759; color: white; padding: 8px; "
-            "border-radius: 8px; font-weight: bold; }"
-            "QPushButton:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }"
-        )
+        self.run_btn.setObjectName("runBtn")
         self.run_btn.setToolTip("Compile and upload code to Codebot Air")
         self.run_btn.setEnabled(False)
         self.run_btn.clicked.connect(self._run_code)
@@ -909,11 +1584,7 @@ class RobotControlApp(QMainWindow):
 
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setFixedWidth(90)
-        self.stop_btn.setStyleSheet(
-            "QPushButton { background-color: #FF3B30; color: white; padding: 8px; "
-            "border-radius: 8px; font-weight: bold; }"
-            "QPushButton:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }"
-        )
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.setToolTip("Stop the robot")
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self._stop_robot)
@@ -925,15 +1596,36 @@ class RobotControlApp(QMainWindow):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
 
-        self._build_robot_control_tab()
-        self._build_code_editor_tab()
-        self._build_roboapps_tab()
-
-        # USB port scanner — updates every 2 seconds
+        # Only the Robot Control tab is built up front; the Code Editor and
+        # RoboApps tabs (file-tree walk, highlighters, disk reads) are built
+        # lazily on first activation so the window paints sooner
+        self.tabs.addTab(self._build_robot_control_tab(), "Robot Control")
+        self.tabs.addTab(QWidget(), "Code Editor")
+        self.tabs.addTab(QWidget(), "RoboApps")
+        self._tab_built = [True, False, False]
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+
+        # USB port scanner — updates every 2 seconds. Coarse timer so Qt can
+        # coalesce wakeups (a precise timer bumps the platform timer
+        # resolution on Windows and drains laptop batteries at idle).
         self._usb_timer = QTimer(self)
+        self._usb_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._usb_timer.setInterval(2000)
         self._usb_timer.timeout.connect(self._scan_usb_ports)
-        self._usb_timer.start()
+
+        # Prefer OS hotplug notifications over polling — the timer only
+        # runs on platforms without a hook (e.g. macOS). Hotplug events
+        # arrive in bursts (one per interface of a composite device), so a
+        # short debounce coalesces them into a single rescan.
+        self._usb_debounce = QTimer(self)
+        self._usb_debounce.setSingleShot(True)
+        self._usb_debounce.setInterval(100)
+        self._usb_debounce.timeout.connect(self._scan_usb_ports)
+        self._usb_changed.connect(self._usb_debounce.start)
+        if self._install_usb_hotplug_hook():
+            QTimer.singleShot(0, self._scan_usb_ports)
+        else:
+            self._usb_timer.start()
 
     # ------------------------------------------------------------------ #
     #  Tab 1: Robot Control                                                #
@@ -965,17 +1657,21 @@ class RobotControlApp(QMainWindow):
 
         btn_row = QHBoxLayout()
         self.connect_btn = QPushButton("Connect")
-        self.connect_btn.setStyleSheet(
-            "QPushButton { background-color: #007AFF; color: white; padding: 8px; border-radius: 8px; }"
-            "QPushButton:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }"
-        )
+        self.connect_btn.setObjectName("primaryBtn")
         self.connect_btn.setMinimumWidth(100)
         self.connect_btn.setEnabled(False)
         self.connect_btn.clicked.connect(self._do_usb_connect)
         btn_row.addWidget(self.connect_btn)
 
         self.conn_status = QLabel("Not connected")
-        self.conn_status.setStyleSheet("color: #FF3B30; font-weight: bold; padding-left: 8px;")
+        # Both colour states live in one stylesheet; toggling the 'state'
+        # property just repolishes this label instead of re-resolving a
+        # fresh stylesheet on every connect/disconnect
+        self.conn_status.setStyleSheet(
+            "QLabel { font-weight: bold; padding-left: 8px; }"
+            "QLabel[state='connected'] { color: #34C759; }"
+            "QLabel[state='disconnected'] { color: #FF3B30; }")
+        self.conn_status.setProperty("state", "disconnected")
         btn_row.addWidget(self.conn_status)
         btn_row.addStretch()
         conn_layout.addLayout(btn_row)
@@ -1050,18 +1746,13 @@ class RobotControlApp(QMainWindow):
         _btn_row.setContentsMargins(0, 0, 0, 0)
 
         self.save_btn = QPushButton("Save")
-        self.save_btn.setStyleSheet(
-            "background-color: #34C759; color: white; padding: 8px; border-radius: 8px;"
-        )
+        self.save_btn.setObjectName("saveBtn")
         self.save_btn.setMinimumWidth(100)
         self.save_btn.clicked.connect(self.save)
         _btn_row.addWidget(self.save_btn)
 
         self.deploy_btn = QPushButton("Deploy")
-        self.deploy_btn.setStyleSheet(
-            "QPushButton { background-color: #007AFF; color: white; padding: 8px; border-radius: 8px; }"
-            "QPushButton:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }"
-        )
+        self.deploy_btn.setObjectName("primaryBtn")
         self.deploy_btn.setMinimumWidth(100)
         self.deploy_btn.clicked.connect(self.deploy)
         self.deploy_btn.setEnabled(False)
@@ -1078,15 +1769,32 @@ class RobotControlApp(QMainWindow):
         # --- Log area ---
         log_group = QGroupBox("Log Output")
         log_layout = QVBoxLayout()
-        self.log_area = QTextEdit()
+        # Plain-text widget: line-oriented layout (no rich-text parsing per
+        # append) and a block cap so long sessions can't grow unbounded
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(5000)
         self.log_area.setFont(QFont("Menlo", 11))
         self.log_area.setMinimumHeight(300)
         log_layout.addWidget(self.log_area)
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
 
-        self.tabs.addTab(tab, "Robot Control")
+        return tab
+
+    def _ensure_tab_built(self, index):
+        """Build the Code Editor / RoboApps tab contents on first activation."""
+        if not (0 <= index < len(self._tab_built)) or self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        builders = {1: self._build_code_editor_tab, 2: self._build_roboapps_tab}
+        # Fill the placeholder in place — removeTab/insertTab of the
+        # current tab momentarily selects the neighbouring placeholder,
+        # re-entering this slot and building that tab too (with a visible
+        # tab flicker on top)
+        holder = QVBoxLayout(self.tabs.widget(index))
+        holder.setContentsMargins(0, 0, 0, 0)
+        holder.addWidget(builders[index]())
     # ------------------------------------------------------------------ #
 
     def _build_code_editor_tab(self):
@@ -1097,42 +1805,28 @@ class RobotControlApp(QMainWindow):
         top_bar = QHBoxLayout()
 
         # Undo / Redo buttons (high-contrast circular style)
-        _circle_btn_style = (
-            "QPushButton { font-size: 20px; font-weight: bold;"
-            "  min-width: 36px; max-width: 36px;"
-            "  min-height: 36px; max-height: 36px; border-radius: 18px;"
-            "  background-color: #007AFF; color: white;"
-            "  border: 2px solid #005ECB; }"
-            "QPushButton:hover { background-color: #005ECB; }"
-        )
         self.undo_btn = QPushButton("\u21BA")          # ↺ anti-clockwise
         self.undo_btn.setToolTip("Undo")
-        self.undo_btn.setStyleSheet(_circle_btn_style)
+        self.undo_btn.setObjectName("circleBtn")
         self.undo_btn.clicked.connect(self._undo)
         top_bar.addWidget(self.undo_btn)
 
         self.redo_btn = QPushButton("\u21BB")          # ↻ clockwise
         self.redo_btn.setToolTip("Redo")
-        self.redo_btn.setStyleSheet(_circle_btn_style)
+        self.redo_btn.setObjectName("circleBtn")
         self.redo_btn.clicked.connect(self._redo)
         top_bar.addWidget(self.redo_btn)
 
-        _toggle_btn_style = (
-            "QPushButton { border: none; padding: 6px 16px; border-radius: 8px;"
-            "  color: white; background: #8E8E93; font-size: 13px; }"
-            "QPushButton:checked { background: #007AFF; }"
-        )
-
         self.simple_view_btn = QPushButton("Simple View")
         self.simple_view_btn.setCheckable(True)
         self.simple_view_btn.setChecked(True)
-        self.simple_view_btn.setStyleSheet(_toggle_btn_style)
+        self.simple_view_btn.setObjectName("viewToggleBtn")
         self.simple_view_btn.clicked.connect(self._show_simple_view)
         top_bar.addWidget(self.simple_view_btn)
 
         self.full_view_btn = QPushButton("Expert View")
         self.full_view_btn.setCheckable(True)
-        self.full_view_btn.setStyleSheet(_toggle_btn_style)
+        self.full_view_btn.setObjectName("viewToggleBtn")
         self.full_view_btn.clicked.connect(self._show_full_view)
         top_bar.addWidget(self.full_view_btn)
 
@@ -1146,24 +1840,20 @@ class RobotControlApp(QMainWindow):
         # Font size buttons (high-contrast circular style)
         self.font_smaller_btn = QPushButton("A")
         self.font_smaller_btn.setToolTip("Decrease font size")
-        self.font_smaller_btn.setStyleSheet(
-            _circle_btn_style + " QPushButton { font-size: 14px; }"
-        )
+        self.font_smaller_btn.setObjectName("circleBtnSmall")
         self.font_smaller_btn.clicked.connect(self._decrease_font_size)
         top_bar.addWidget(self.font_smaller_btn)
 
         self.font_larger_btn = QPushButton("A")
         self.font_larger_btn.setToolTip("Increase font size")
-        self.font_larger_btn.setStyleSheet(
-            _circle_btn_style + " QPushButton { font-size: 20px; }"
-        )
+        self.font_larger_btn.setObjectName("circleBtnLarge")
         self.font_larger_btn.clicked.connect(self._increase_font_size)
         top_bar.addWidget(self.font_larger_btn)
 
         # Full View: search button
         self.fv_search_btn = QPushButton("\U0001F50D")
         self.fv_search_btn.setToolTip("Search in code")
-        self.fv_search_btn.setStyleSheet(_circle_btn_style)
+        self.fv_search_btn.setObjectName("circleBtn")
         self.fv_search_btn.clicked.connect(self._fv_toggle_search)
         top_bar.addWidget(self.fv_search_btn)
         self.fv_search_btn.hide()
@@ -1171,45 +1861,32 @@ class RobotControlApp(QMainWindow):
         # Full View: add (+) button
         self.fv_add_btn = QPushButton("+")
         self.fv_add_btn.setToolTip("Add package or file")
-        self.fv_add_btn.setStyleSheet(_circle_btn_style)
+        self.fv_add_btn.setObjectName("circleBtn")
         self.fv_add_btn.clicked.connect(self._fv_add_menu)
         top_bar.addWidget(self.fv_add_btn)
         self.fv_add_btn.hide()
 
         # Full View: delete (−) button
-        _fv_delete_btn_style = (
-            "QPushButton { font-size: 20px; font-weight: bold;"
-            "  min-width: 36px; max-width: 36px;"
-            "  min-height: 36px; max-height: 36px; border-radius: 18px;"
-            "  background-color: #FF3B30; color: white;"
-            "  border: 2px solid #CC2A22; }"
-            "QPushButton:hover { background-color: #CC2A22; }"
-            "QPushButton:checked { background-color: #CC2A22;"
-            "  border: 2px solid #FFFFFF; }"
-        )
         self.fv_delete_btn = QPushButton("\u2212")
         self.fv_delete_btn.setToolTip("Delete mode — click red X to remove items")
         self.fv_delete_btn.setCheckable(True)
-        self.fv_delete_btn.setStyleSheet(_fv_delete_btn_style)
+        self.fv_delete_btn.setObjectName("circleDeleteBtn")
         self.fv_delete_btn.clicked.connect(self._fv_toggle_delete_mode)
         top_bar.addWidget(self.fv_delete_btn)
         self.fv_delete_btn.hide()
 
         self.editor_save_btn = QPushButton("Save")
-        self.editor_save_btn.setStyleSheet(
-            "QPushButton { background-color: #34C759; color: white; padding: 6px 14px; border-radius: 8px; }"
-        )
+        self.editor_save_btn.setObjectName("editorSaveBtn")
         self.editor_save_btn.setMinimumWidth(100)
         self.editor_save_btn.clicked.connect(self._save_from_editor)
         top_bar.addWidget(self.editor_save_btn)
 
         self.editor_deploy_btn = QPushButton("Deploy")
-        self.editor_deploy_btn.setStyleSheet(
-            "QPushButton { background-color: #007AFF; color: white; padding: 6px 14px; border-radius: 8px; }"
-            "QPushButton:disabled { background-color: #B0B0B0; color: #707070; border-radius: 8px; }"
-        )
+        self.editor_deploy_btn.setObjectName("editorDeployBtn")
         self.editor_deploy_btn.setMinimumWidth(100)
-        self.editor_deploy_btn.setEnabled(False)
+        # Tab may be built after a device has already auto-connected
+        self.editor_deploy_btn.setEnabled(
+            self._serial_conn is not None and self._serial_conn.is_open)
         self.editor_deploy_btn.clicked.connect(self._deploy_from_editor)
         top_bar.addWidget(self.editor_deploy_btn)
 
@@ -1237,7 +1914,7 @@ class RobotControlApp(QMainWindow):
         self._simple_highlighter = SimpleCodeHighlighter(
             self.simple_editor.document()
         )
-        self.simple_editor.textChanged.connect(self._on_simple_code_changed)
+        self.simple_editor.textChanged.connect(self._parse_pending.start)
         simple_view_splitter.addWidget(self.simple_editor)
 
         simple_view_splitter.setStretchFactor(0, 0)   # panel: fixed
@@ -1258,6 +1935,14 @@ class RobotControlApp(QMainWindow):
         _sb_layout.setContentsMargins(4, 4, 4, 4)
         self._fv_search_input = QLineEdit()
         self._fv_search_input.setPlaceholderText("Search...")
+        # One shared format object for every search-highlight selection
+        self._fv_highlight_fmt = QTextCharFormat()
+        self._fv_highlight_fmt.setBackground(QColor("#FFE082"))
+        # Debounce: re-highlight once per typing pause, not per keystroke
+        self._fv_search_timer = QTimer(self)
+        self._fv_search_timer.setSingleShot(True)
+        self._fv_search_timer.setInterval(80)
+        self._fv_search_timer.timeout.connect(self._fv_do_search)
         self._fv_search_input.textChanged.connect(self._fv_perform_search)
         _sb_layout.addWidget(self._fv_search_input)
         _sb_close = QPushButton("\u2715")
@@ -1297,6 +1982,15 @@ class RobotControlApp(QMainWindow):
         self.file_tree.itemChanged.connect(self._fv_tree_item_changed)
         fv_left_layout.addWidget(self.file_tree)
 
+        # Watch the project tree so external add/delete/rename shows up
+        # without a manual refresh; reloads are debounced and diffed
+        self._fs_watcher = QFileSystemWatcher([_PKG_DIR], self)
+        self._fs_watcher.directoryChanged.connect(self._on_fs_change)
+        self._fs_reload = QTimer(self)
+        self._fs_reload.setSingleShot(True)
+        self._fs_reload.setInterval(200)
+        self._fs_reload.timeout.connect(self._load_file_tree)
+
         full_layout.addWidget(fv_left_container)
 
         self.full_editor = LineNumberEditor()
@@ -1311,16 +2005,24 @@ class RobotControlApp(QMainWindow):
 
         layout.addWidget(self.editor_stack)
 
-        self.tabs.addTab(tab, "Code Editor")
-
         # Populate views
         self._load_file_tree()
         self._load_simple_view_from_movement_py()
 
-        # Auto-save timer (every 5 seconds)
+        # Debounced auto-save: editors mark themselves dirty and a single-
+        # shot timer batches the disk write 5 s after the last change, so
+        # an idle app writes nothing
         self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(5000)
+        self._autosave_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._autosave_timer.timeout.connect(self._autosave)
-        self._autosave_timer.start(5000)
+        self.simple_editor.textChanged.connect(
+            lambda: self._mark_dirty('simple'))
+        self.full_editor.textChanged.connect(
+            lambda: self._mark_dirty('full'))
+
+        return tab
 
     # ------------------------------------------------------------------ #
     #  Tab 4: RoboApps                                                     #
@@ -1361,22 +2063,7 @@ class RobotControlApp(QMainWindow):
         # RoboSim app icon (iPhone-style)
         robosim_btn = QPushButton("RoboSim")
         robosim_btn.setFixedSize(120, 120)
-        robosim_btn.setStyleSheet(
-            "QPushButton {"
-            "  background-color: #007AFF;"
-            "  color: white;"
-            "  font-size: 16px;"
-            "  font-weight: bold;"
-            "  border-radius: 27px;"
-            "  border: none;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #005ECB;"
-            "}"
-            "QPushButton:pressed {"
-            "  background-color: #004AAD;"
-            "}"
-        )
+        robosim_btn.setObjectName("appIconBtn")
         robosim_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         robosim_btn.setToolTip("Launch RoboSim5")
         robosim_btn.clicked.connect(self._launch_robosim)
@@ -1387,15 +2074,17 @@ class RobotControlApp(QMainWindow):
         main_area_layout.addStretch()
         layout.addWidget(main_area)
 
-        self.tabs.addTab(tab, "RoboApps")
+        return tab
 
     def _launch_robosim(self):
-        """Launch RoboSim5 as a subprocess: python RobotSim5.py"""
-        if self._robosim_proc is not None and self._robosim_proc.poll() is None:
-            self._log(f"RoboSim is already running (PID {self._robosim_proc.pid}).")
+        """Launch RoboSim5 as a child process: python RobotSim5.py"""
+        if (self._robosim_proc is not None
+                and self._robosim_proc.state() != QProcess.ProcessState.NotRunning):
+            self._log("RoboSim is already running "
+                      f"(PID {self._robosim_proc.processId()}).")
             return
 
-        robosim_dir = os.path.join(_PKG_DIR, "roboapps", "RobotSim5")
+        robosim_dir = os.path.join(_ROBOAPPS_DIR, "RobotSim5")
         script = "RobotSim5.py"
 
         if not os.path.isfile(os.path.join(robosim_dir, script)):
@@ -1403,15 +2092,20 @@ class RobotControlApp(QMainWindow):
             return
 
         self._log("Launching RoboSim5...")
-        try:
-            self._robosim_proc = subprocess.Popen(
-                [sys.executable, script],
-                cwd=robosim_dir,
-                start_new_session=True,
-            )
-            self._log(f"  RoboSim5 started (PID {self._robosim_proc.pid}).")
-        except Exception as e:
-            self._log(f"ERROR launching RoboSim5: {e}")
+        # QProcess hooks into the event loop — start/exit/errors arrive as
+        # signals instead of a poll() on the next button press
+        proc = QProcess(self)
+        proc.setProgram(sys.executable)
+        proc.setArguments([script])
+        proc.setWorkingDirectory(robosim_dir)
+        proc.started.connect(
+            lambda: self._log(f"  RoboSim5 started (PID {proc.processId()})."))
+        proc.finished.connect(
+            lambda rc, _st: self._log(f"RoboSim5 exited (code {rc})."))
+        proc.errorOccurred.connect(
+            lambda err: self._log(f"ERROR launching RoboSim5: {err.name}"))
+        self._robosim_proc = proc
+        proc.start()
 
     # --- Support dialog ---
 
@@ -1460,15 +2154,16 @@ class RobotControlApp(QMainWindow):
                 f"?subject={urllib.parse.quote(subj)}"
                 f"&body={urllib.parse.quote(body)}"
             )
-            try:
-                subprocess.Popen(["open", mailto_url])
+            # QDesktopServices dispatches via the Qt platform plugin on
+            # every OS — no fork/exec of the macOS `open` helper
+            if QDesktopServices.openUrl(QUrl(mailto_url)):
                 QMessageBox.information(dialog, "Email Client Opened",
                                         "Your default email client has been opened "
                                         "with the support request pre-filled.")
                 dialog.accept()
-            except Exception as e:
+            else:
                 QMessageBox.critical(dialog, "Error",
-                                     f"Could not open email client: {e}")
+                                     "Could not open email client.")
 
         send_btn.clicked.connect(_on_send)
         dialog.exec()
@@ -1487,13 +2182,22 @@ class RobotControlApp(QMainWindow):
         else:
             self.full_editor.redo()
 
+    def _mark_dirty(self, which):
+        """Flag an editor as modified and (re)arm the autosave timer."""
+        if which == 'simple':
+            self._dirty_simple = True
+        else:
+            self._dirty_full = True
+        self._autosave_timer.start()
+
     def _autosave(self):
-        """Auto-save: persist editor content to disk every 5 seconds."""
-        if self.editor_stack.currentIndex() == 0:
+        """Debounced auto-save: write only the editors changed since last save."""
+        if self._dirty_simple:
+            self._dirty_simple = False
             # Simple View — write params + logic to movement.py
-            self._write_params_to_movement_py()
-            self._write_simple_logic_to_movement_py()
-        else:
+            self._write_movement_py_from_simple_view()
+        if self._dirty_full:
+            self._dirty_full = False
             self._save_full_view_file()
 
     def _change_font_size(self, delta):
@@ -1515,267 +2219,309 @@ class RobotControlApp(QMainWindow):
 
     # --- Simple View helpers ---
 
+    def _param_snapshot(self):
+        """Current parameter values as a dict for template interpolation."""
+        return {
+            'fwd': self.forward_speed.value(),
+            'bwd': self.backward_speed.value(),
+            'turn': self.turn_speed.value(),
+            'obs': self.obstacle_distance.value(),
+            'cw': self.turn_cw.value(),
+            'acw': self.turn_acw.value(),
+            'colour': self.colour_detection.currentText(),
+        }
+
     def _generate_simple_code(self):
         """Generate Codebot Air default code from current parameter values."""
-        fwd = self.forward_speed.value()
-        bwd = self.backward_speed.value()
-        turn = self.turn_speed.value()
-        obs = self.obstacle_distance.value()
-        cw = self.turn_cw.value()
-        acw = self.turn_acw.value()
-        colour = self.colour_detection.currentText()
-
-        return (
-            f'from codebotair import Robot\n'
-            f'\n'
-            f'class Movement(Robot):\n'
-            f'    def __init__(self):\n'
-            f'        super().__init__()\n'
-            f'        # === Editable Parameters ===\n'
-            f'        self.forward_speed = {fwd:.2f}       # m/s  \u2190 edit\n'
-            f'        self.backward_speed = {bwd:.2f}      # m/s  \u2190 edit\n'
-            f'        self.turn_speed = {turn:.2f}          # rad/s  \u2190 edit\n'
-            f'        self.obstacle_distance = {obs:.2f}   # metres  \u2190 edit\n'
-            f'        self.turn_cw_deg = {cw:.1f}         # degrees CW  \u2190 edit\n'
-            f'        self.turn_acw_deg = {acw:.1f}        # degrees ACW  \u2190 edit\n'
-            f'        self.colour_detection = "{colour}"   # Red|Blue|Yellow|Green  \u2190 edit\n'
-            f'\n'
-            f'    # vvv Drag and drop functions below vvv\n'
-            f'\n'
-            f'    def control_loop(self):\n'
-            f'        # === Movement Logic ===\n'
-            f'        if self.obstacle_in_front():\n'
-            f'            self.stop()                       # stop movement\n'
-            f'            self.turn_cw(self.turn_cw_deg)    # turn clockwise  \u2190 edit\n'
-            f'        else:\n'
-            f'            self.move(self.forward_speed)     # drive forward  \u2190 edit\n'
-        )
+        snapshot = self._param_snapshot()
+        key = tuple(snapshot.values())
+        # Memoize the last render \u2014 several signal handlers may ask for the
+        # same parameter set in one burst
+        if key != self._simple_code_key:
+            self._simple_code_key = key
+            self._simple_code_cache = _SIMPLE_CODE_TEMPLATE.format_map(snapshot)
+        return self._simple_code_cache
+
+    def _set_simple_code(self, text):
+        """Replace the Simple View text with signals blocked (no re-entrant sync).
+
+        QSignalBlocker suppresses every textChanged listener at the C++
+        layer, so re-arm the two that still matter by hand: the editor's
+        logic-line cache and the autosave dirty flag.
+        """
+        with QSignalBlocker(self.simple_editor):
+            self.simple_editor.setPlainText(text)
+        self.simple_editor._invalidate_logic_line_cache()
+        self._mark_dirty('simple')
 
     def _on_simple_code_changed(self):
         """Parse Simple View text and update spinboxes in Robot Control tab."""
-        if self._syncing:
-            return
-        self._syncing = True
+        # Blockers stop each setValue from echoing back into the editor sync
+        blockers = [QSignalBlocker(w) for w in (
+            self.forward_speed, self.backward_speed, self.turn_speed,
+            self.obstacle_distance, self.turn_cw, self.turn_acw,
+            self.colour_detection)]
         try:
             text = self.simple_editor.toPlainText()
-            m = re.search(r'self\.forward_speed\s*=\s*([\d.]+)', text)
-            if m:
-                self.forward_speed.setValue(float(m.group(1)))
-            m = re.search(r'self\.backward_speed\s*=\s*([\d.]+)', text)
-            if m:
-                self.backward_speed.setValue(float(m.group(1)))
-            m = re.search(r'self\.turn_speed\s*=\s*([\d.]+)', text)
-            if m:
-                self.turn_speed.setValue(float(m.group(1)))
-            m = re.search(r'self\.obstacle_distance\s*=\s*([\d.]+)', text)
-            if m:
-                self.obstacle_distance.setValue(float(m.group(1)))
-            m = re.search(r'self\.turn_cw_deg\s*=\s*([\d.]+)', text)
-            if m:
-                self.turn_cw.setValue(float(m.group(1)))
-            m = re.search(r'self\.turn_acw_deg\s*=\s*([\d.]+)', text)
-            if m:
-                self.turn_acw.setValue(float(m.group(1)))
-            m = re.search(r'self\.colour_detection\s*=\s*"([^"]+)"', text)
-            if m:
-                colour = m.group(1)
-                if colour in ["Red", "Blue", "Yellow", "Green"]:
-                    self.colour_detection.setCurrentText(colour)
+            for rx, attr in _PARAM_READ_SPECS:
+                m = rx.search(text)
+                if m:
+                    getattr(self, attr).setValue(float(m.group(1)))
+            m = _COLOUR_READ_RE.search(text)
+            if m and m.group(1) in ("Red", "Blue", "Yellow", "Green"):
+                self.colour_detection.setCurrentText(m.group(1))
         finally:
-            self._syncing = False
+            del blockers
+
+    def _apply_param_subs(self, code):
+        """Substitute current widget values into *code* in one regex pass.
+
+        Only the first occurrence of each assignment (in __init__) is
+        replaced, leaving any duplicates in the logic section untouched.
+        """
+        seen = set()
+
+        def _repl(m):
+            name = m.lastgroup
+            if name in seen:
+                return m.group(0)
+            seen.add(name)
+            if name == 'colour':
+                return m.group(name) + self.colour_detection.currentText() + '"'
+            value = _PARAM_FMTS[name].format(getattr(self, name).value())
+            return m.group(name) + value
+
+        return _PARAM_UNION_RE.sub(_repl, code)
+
+    def _apply_param_edits(self, editor, text=None):
+        """Write current widget values into *editor* as targeted cursor edits.
+
+        Unlike setPlainText, replacing just the literal spans keeps the
+        undo stack and the user's cursor, and Qt re-lays-out only the
+        touched lines. First occurrence per assignment only, matching
+        _apply_param_subs. Callers that already materialized the document
+        pass *text* to skip a second toPlainText walk. Returns True if
+        anything changed.
+        """
+        if text is None:
+            text = editor.toPlainText()
+        edits = []
+        seen = set()
+        for m in _PARAM_UNION_RE.finditer(text):
+            name = m.lastgroup
+            if name in seen:
+                continue
+            seen.add(name)
+            if name == 'colour':
+                new = self.colour_detection.currentText() + '"'
+            else:
+                new = _PARAM_FMTS[name].format(getattr(self, name).value())
+            if text[m.end(name):m.end()] != new:
+                edits.append((m.end(name), m.end(), new))
+        if not edits:
+            return False
+        cursor = QTextCursor(editor.document())
+        cursor.beginEditBlock()
+        # Apply back-to-front so earlier spans keep their offsets
+        for start, end, new in reversed(edits):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(new)
+        cursor.endEditBlock()
+        return True
 
     def _sync_simple_view_from_spinboxes(self):
+        """Schedule a Simple View sync on the next event-loop tick."""
+        # Widget edits outlive the debounce: until they reach movement.py
+        # a reload from the file must not stomp them (e.g. edits made
+        # before the editor tab is first built)
+        self._params_dirty = True
+        self._sync_pending.start()
+
+    def _sync_simple_view_from_spinboxes_impl(self):
         """Update Simple View parameter values in-place (preserves user logic)."""
-        if self._syncing:
+        if not self._tab_built[1]:
+            return  # editor tab not built yet — it loads fresh on first open
+        # Materialize the document once for the empty check and the edits
+        text = self.simple_editor.toPlainText()
+        # First launch — editor is empty, generate fresh code
+        if not text.strip():
+            self._set_simple_code(self._generate_simple_code())
             return
-        self._syncing = True
-        try:
-            code = self.simple_editor.toPlainText()
-            # First launch — editor is empty, generate fresh code
-            if not code.strip():
-                self.simple_editor.setPlainText(self._generate_simple_code())
-                return
 
-            # In-place regex replacement of parameter values only.
-            # Use count=1 to only replace the first occurrence (in __init__),
-            # leaving any duplicates in the logic section untouched.
-            replacements = [
-                (r'(self\.forward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.forward_speed.value():.2f}'),
-                (r'(self\.backward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.backward_speed.value():.2f}'),
-                (r'(self\.turn_speed\s*=\s*)[\d.]+', rf'\g<1>{self.turn_speed.value():.2f}'),
-                (r'(self\.obstacle_distance\s*=\s*)[\d.]+', rf'\g<1>{self.obstacle_distance.value():.2f}'),
-                (r'(self\.turn_cw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_cw.value():.1f}'),
-                (r'(self\.turn_acw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_acw.value():.1f}'),
-                (r'(self\.colour_detection\s*=\s*")[^"]*"',
-                 rf'\g<1>{self.colour_detection.currentText()}"'),
-            ]
-            new_code = code
-            for pattern, repl in replacements:
-                new_code = re.sub(pattern, repl, new_code, count=1)
-
-            if new_code != code:
-                # Save and restore cursor position
-                cursor = self.simple_editor.textCursor()
-                pos = cursor.position()
-                self.simple_editor.setPlainText(new_code)
-                cursor = self.simple_editor.textCursor()
-                cursor.setPosition(min(pos, len(new_code)))
-                self.simple_editor.setTextCursor(cursor)
-        finally:
-            self._syncing = False
+        # In-place cursor edits preserve user logic, cursor and undo
+        with QSignalBlocker(self.simple_editor):
+            changed = self._apply_param_edits(self.simple_editor, text)
+        if changed:
+            self.simple_editor._invalidate_logic_line_cache()
+            self._mark_dirty('simple')
 
     def _sync_full_view_from_spinboxes(self):
         """Apply current spinbox parameter values to the Full View editor."""
-        code = self.full_editor.toPlainText()
-        if not code.strip():
+        text = self.full_editor.toPlainText()
+        if not text.strip():
             return
-        replacements = [
-            (r'(self\.forward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.forward_speed.value():.2f}'),
-            (r'(self\.backward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.backward_speed.value():.2f}'),
-            (r'(self\.turn_speed\s*=\s*)[\d.]+', rf'\g<1>{self.turn_speed.value():.2f}'),
-            (r'(self\.obstacle_distance\s*=\s*)[\d.]+', rf'\g<1>{self.obstacle_distance.value():.2f}'),
-            (r'(self\.turn_cw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_cw.value():.1f}'),
-            (r'(self\.turn_acw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_acw.value():.1f}'),
-            (r'(self\.colour_detection\s*=\s*")[^"]*"',
-             rf'\g<1>{self.colour_detection.currentText()}"'),
-        ]
-        new_code = code
-        for pattern, repl in replacements:
-            new_code = re.sub(pattern, repl, new_code, count=1)
-        if new_code != code:
-            cursor = self.full_editor.textCursor()
-            pos = cursor.position()
-            self.full_editor.setPlainText(new_code)
-            cursor = self.full_editor.textCursor()
-            cursor.setPosition(min(pos, len(new_code)))
-            self.full_editor.setTextCursor(cursor)
+        # textChanged still fires on edits, so the dirty flag arms itself
+        self._apply_param_edits(self.full_editor, text)
 
     # --- Simple View ↔ movement.py sync engine ---
 
     def _extract_simple_view_logic(self):
         """Extract the control_loop body text from the Simple View editor."""
-        text = self.simple_editor.toPlainText()
-        lines = text.split('\n')
-        logic_start = None
-        for i, line in enumerate(lines):
-            if '# === Movement Logic ===' in line:
-                logic_start = i + 1
-                break
-        if logic_start is None:
-            return None
-        logic_lines = lines[logic_start:]
-        # Strip trailing empty lines
-        while logic_lines and not logic_lines[-1].strip():
-            logic_lines.pop()
-        if not logic_lines:
+        if not self._tab_built[1]:
+            return None  # editor never opened — nothing to extract
+        m = _LOGIC_EXTRACT_RE.search(self.simple_editor.toPlainText())
+        if not m:
             return None
-        return '\n'.join(logic_lines)
-
-    def _write_simple_logic_to_movement_py(self):
-        """Replace the control_loop user section in movement.py with Simple View logic."""
-        logic = self._extract_simple_view_logic()
-        if logic is None:
-            return
-        if not os.path.isfile(MOVEMENT_PY):
-            return
-        with open(MOVEMENT_PY, 'r') as f:
-            code = f.read()
+        return m.group(1).rstrip() or None
 
-        marker_start = '        # user control_loop logic below\n'
-        marker_end = '        # end user control_loop logic'
+    def _write_movement_py_from_simple_view(self):
+        """Persist spinbox params and Simple View logic to movement.py.
 
-        start_idx = code.find(marker_start)
-        end_idx = code.find(marker_end)
-        if start_idx == -1 or end_idx == -1:
+        Both transforms happen in memory on one read of the file, so the
+        save path costs a single read-modify-write cycle instead of two.
+        """
+        if not self._movement_py_exists:
             return
-
-        new_code = code[:start_idx + len(marker_start)] + logic + '\n' + code[end_idx:]
-
+        # Flush the debounced editor→spinbox parse so a Save/Deploy right
+        # after typing a value doesn't write the stale spinbox numbers
+        if self._parse_pending.isActive():
+            self._parse_pending.stop()
+            self._on_simple_code_changed()
+        code = self._read_movement()
+        if code is None:
+            return  # deleted externally — nothing to update
+        new_code = self._apply_param_subs(code)
+        logic = self._extract_simple_view_logic()
+        if logic is not None:
+            new_code = _apply_logic_splice(new_code, logic)
         if new_code != code:
-            with open(MOVEMENT_PY, 'w') as f:
-                f.write(new_code)
+            self._write_movement(new_code)
+        self._params_dirty = False
 
     def _load_simple_view_from_movement_py(self):
         """Read movement.py markers and rebuild Simple View with current params + saved logic."""
-        if not os.path.isfile(MOVEMENT_PY):
+        if self._params_dirty:
+            # Spinbox edits not yet persisted (made before the editor tab
+            # was built, or inside the autosave window) — write them out
+            # first so the reload below reflects them instead of reverting
+            self._write_movement_py_from_simple_view()
+        if not self._movement_py_exists:
             # No movement.py — populate with generated default if editor is empty
             if not self.simple_editor.toPlainText().strip():
-                self._syncing = True
-                try:
-                    self.simple_editor.setPlainText(self._generate_simple_code())
-                finally:
-                    self._syncing = False
+                self._set_simple_code(self._generate_simple_code())
             return
-        with open(MOVEMENT_PY, 'r') as f:
-            code = f.read()
+
+        code = self._read_movement()
+        if code is None:
+            # Vanished between the existence check and the read — same
+            # treatment as the no-movement.py branch above
+            if not self.simple_editor.toPlainText().strip():
+                self._set_simple_code(self._generate_simple_code())
+            return
+        # Apply the file's parameter values to the spinboxes in one batch —
+        # blockers stop each setValue from firing a full editor sync
+        widget_map = {
+            'forward_speed': self.forward_speed,
+            'backward_speed': self.backward_speed,
+            'turn_speed': self.turn_speed,
+            'obstacle_distance': self.obstacle_distance,
+            'turn_cw_deg': self.turn_cw,
+            'turn_acw_deg': self.turn_acw,
+        }
+        blockers = [QSignalBlocker(w)
+                    for w in (*widget_map.values(), self.colour_detection)]
+        for m in _PARAM_RE.finditer(code):
+            widget = widget_map.get(m.group(1))
+            if widget is None:
+                continue  # assignment in the user logic — not a parameter
+            try:
+                widget.setValue(float(m.group(2)))
+            except ValueError:
+                # expressions like `= 90-45` also match the value class —
+                # an unhandled slot exception would abort the app
+                continue
+        del blockers
 
         # Extract logic between markers
-        m = re.search(
-            r'        # user control_loop logic below\n(.*?)        # end user control_loop logic',
-            code, re.DOTALL,
-        )
+        m = _LOGIC_SPLICE_RE.search(code)
         if not m:
             # No markers — fall back to generated default
-            self._syncing = True
-            try:
-                self.simple_editor.setPlainText(self._generate_simple_code())
-            finally:
-                self._syncing = False
+            self._set_simple_code(self._generate_simple_code())
             return
 
-        saved_logic = m.group(1).rstrip('\n')
+        saved_logic = m.group(2).rstrip('\n')
 
         # Build Simple View with current spinbox params and saved logic
         base_code = self._generate_simple_code()
-        lines = base_code.split('\n')
-        logic_start = None
-        for i, line in enumerate(lines):
-            if '# === Movement Logic ===' in line:
-                logic_start = i + 1
-                break
-        if logic_start is not None:
-            new_lines = lines[:logic_start]
-            new_lines.append(saved_logic)
-            base_code = '\n'.join(new_lines) + '\n'
+        m = _LOGIC_EXTRACT_RE.search(base_code)
+        if m:
+            base_code = base_code[:m.start(1)] + saved_logic + '\n'
+
+        self._set_simple_code(base_code)
+
+    def _read_movement(self):
+        """Return movement.py text, served from an mtime-keyed cache.
 
-        self._syncing = True
+        Stats the file first; a matching st_mtime_ns means the content on
+        disk is what we last read or wrote, so the read is skipped.
+        Returns None (and drops the cached existence flag) if the file
+        vanished since the flag was last refreshed — slot callers must
+        not let a FileNotFoundError escape, which would abort the app.
+        """
         try:
-            self.simple_editor.setPlainText(base_code)
-        finally:
-            self._syncing = False
+            mtime = os.stat(MOVEMENT_PY).st_mtime_ns
+            cached_mtime, cached_text = self._mv_cache
+            if mtime == cached_mtime:
+                return cached_text
+            with open(MOVEMENT_PY, 'r') as f:
+                text = f.read()
+        except OSError:
+            self._movement_py_exists = False
+            self._mv_cache = (None, None)
+            return None
+        self._mv_cache = (mtime, text)
+        return text
 
-    def _write_params_to_movement_py(self):
-        """Write current spinbox parameter values into movement.py on disk."""
-        if not os.path.isfile(MOVEMENT_PY):
-            return
-        with open(MOVEMENT_PY, 'r') as f:
-            code = f.read()
-
-        replacements = [
-            (r'(self\.forward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.forward_speed.value():.2f}'),
-            (r'(self\.backward_speed\s*=\s*)[\d.]+', rf'\g<1>{self.backward_speed.value():.2f}'),
-            (r'(self\.turn_speed\s*=\s*)[\d.]+', rf'\g<1>{self.turn_speed.value():.2f}'),
-            (r'(self\.obstacle_distance\s*=\s*)[\d.]+', rf'\g<1>{self.obstacle_distance.value():.2f}'),
-            (r'(self\.turn_cw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_cw.value():.1f}'),
-            (r'(self\.turn_acw_deg\s*=\s*)[\d.]+', rf'\g<1>{self.turn_acw.value():.1f}'),
-            (r'(self\.colour_detection\s*=\s*")[^"]*"',
-             rf'\g<1>{self.colour_detection.currentText()}"'),
-        ]
-
-        for pattern, repl in replacements:
-            code = re.sub(pattern, repl, code, count=1)
+    def _write_movement(self, text):
+        """Write movement.py and prime the cache with what was just written.
 
+        When the new text has the same byte length as the file on disk —
+        the usual case for parameter-only edits, where a .2f literal
+        replaces a .2f literal — only the changed 1 KB blocks are patched
+        in place through mmap instead of rewriting the whole file.
+        """
+        data = text.encode()
+        try:
+            if os.path.getsize(MOVEMENT_PY) == len(data):
+                import mmap
+                with open(MOVEMENT_PY, 'r+b') as f, \
+                        mmap.mmap(f.fileno(), 0) as mm:
+                    for off in range(0, len(data), 1024):
+                        chunk = data[off:off + 1024]
+                        if mm[off:off + len(chunk)] != chunk:
+                            mm[off:off + len(chunk)] = chunk
+                self._mv_cache = (os.stat(MOVEMENT_PY).st_mtime_ns, text)
+                return
+        except (OSError, ValueError):
+            pass  # fall back to a plain rewrite
         with open(MOVEMENT_PY, 'w') as f:
-            f.write(code)
+            f.write(text)
+        self._mv_cache = (os.stat(MOVEMENT_PY).st_mtime_ns, text)
 
     def _sync_simple_view_to_full_view(self):
         """Persist Simple View params + logic to movement.py and refresh Full View."""
-        self._write_params_to_movement_py()
-        self._write_simple_logic_to_movement_py()
+        # Flush any debounced spinbox sync so the editor text is current
+        if self._sync_pending.isActive():
+            self._sync_pending.stop()
+            self._sync_simple_view_from_spinboxes_impl()
+        self._write_movement_py_from_simple_view()
         # Reload Full View editor if movement.py is the currently open file
+        # (served from the mtime cache — the write above just primed it)
         if self._full_view_current_file == "movement_pkg/movement.py":
-            with open(MOVEMENT_PY, 'r') as f:
-                self.full_editor.setPlainText(f.read())
+            text = self._read_movement()
+            if text is not None:
+                self.full_editor.setPlainText(text)
 
     def _show_simple_view(self):
         # If switching from Full View, save the file first
@@ -1818,7 +2564,15 @@ class RobotControlApp(QMainWindow):
         else:
             self._fv_search_input.setFocus()
 
+    # Stop highlighting after this many hits — a short search term in a big
+    # file would otherwise allocate an ExtraSelection per occurrence
+    _FV_SEARCH_CAP = 500
+
     def _fv_perform_search(self):
+        """Schedule a debounced search-highlight refresh."""
+        self._fv_search_timer.start()
+
+    def _fv_do_search(self):
         """Highlight all occurrences of the search term in the Full View editor."""
         term = self._fv_search_input.text()
         if not term:
@@ -1827,32 +2581,79 @@ class RobotControlApp(QMainWindow):
 
         selections = []
         doc = self.full_editor.document()
-        highlight_fmt = QTextCharFormat()
-        highlight_fmt.setBackground(QColor("#FFE082"))
-
-        cursor = QTextCursor(doc)
-        while True:
-            cursor = doc.find(term, cursor)
-            if cursor.isNull():
-                break
+        highlight_fmt = self._fv_highlight_fmt
+
+        # Scan the plain text in one C-level pass instead of walking the
+        # document model through repeated doc.find calls
+        text = self.full_editor.toPlainText()
+        # IGNORECASE matches the old doc.find default behaviour
+        for m in re.finditer(re.escape(term), text, re.IGNORECASE):
+            cursor = QTextCursor(doc)
+            cursor.setPosition(m.start())
+            cursor.setPosition(m.end(), QTextCursor.MoveMode.KeepAnchor)
             sel = QTextEdit.ExtraSelection()
             sel.cursor = cursor
             sel.format = highlight_fmt
             selections.append(sel)
+            if len(selections) >= self._FV_SEARCH_CAP:
+                self._log(f"Search: showing first {self._FV_SEARCH_CAP} "
+                          "matches; further matches not highlighted.")
+                break
 
         self.full_editor.setExtraSelections(selections)
 
     # --- Full View helpers ---
 
-    # Directories to hide from the Full View file tree
-    _FV_HIDDEN_DIRS = {"__pycache__", ".git", "resource", "msg", "srv",
-                       ".egg-info"}
-
     def _load_file_tree(self):
-        self._blocking_item_changed = True
+        """Scan the project directory on the thread pool, then rebuild the tree."""
+        self._movement_py_exists = os.path.isfile(MOVEMENT_PY)
+        scanner = _TreeScanner()
+        scanner.signals.done.connect(self._populate_file_tree)
+        self._tree_scanner = scanner  # keep signals alive until done fires
+        QThreadPool.globalInstance().start(scanner)
+
+    def _populate_file_tree(self, entries):
+        self._tree_scanner = None
+        delete_on = self._fv_edit_mode
+        if self._tree_folders is not None and delete_on == self._tree_delete_on:
+            self._diff_file_tree(entries)
+        else:
+            self._rebuild_file_tree(entries, delete_on)
+        self._watch_tree_dirs()
+
+    # -- tree item construction, shared by the rebuild and diff paths --
+
+    def _set_delete_col(self, tree_item, protected, delete_on):
+        if delete_on and not protected:
+            tree_item.setText(1, "\u2716")
+            tree_item.setForeground(1, QColor("#FF3B30"))
+
+    def _make_folder_item(self, dir_name, delete_on):
+        # Built detached — the caller attaches it (in bulk where possible)
+        # and expands it after insertion, since setExpanded needs a view
+        folder_item = QTreeWidgetItem()
+        folder_item.setText(0, f"\U0001F4C1 {dir_name}")
+        folder_item.setFont(0, QFont("Menlo", 11, QFont.Weight.Bold))
+        folder_item.setForeground(0, QColor("#34C759"))
+        self._set_delete_col(
+            folder_item, dir_name in _PROTECTED_FV_FOLDERS, delete_on)
+        return folder_item
+
+    def _make_file_item(self, file_name, rel_path, delete_on):
+        fi = QTreeWidgetItem()
+        fi.setText(0, file_name)
+        fi.setData(0, Qt.ItemDataRole.UserRole, rel_path)
+        fi.setForeground(0, QColor("#007AFF"))
+        self._set_delete_col(fi, rel_path in _PROTECTED_FV_FILES, delete_on)
+        return fi
+
+    def _rebuild_file_tree(self, entries, delete_on):
+        """Full rebuild \u2014 first population and edit-mode toggles."""
+        # Block itemChanged etc. for the whole rebuild
+        blocker = QSignalBlocker(self.file_tree)
+        self.file_tree.setUpdatesEnabled(False)
         self.file_tree.clear()
 
-        delete_on = self._fv_edit_mode
         if delete_on:
             self.file_tree.setColumnCount(2)
             self.file_tree.header().setStretchLastSection(False)
@@ -1864,81 +2665,114 @@ class RobotControlApp(QMainWindow):
         else:
             self.file_tree.setColumnCount(1)
 
-        folders = {}   # dir_name -> QTreeWidgetItem
-        seen_files = set()
+        folders = {}     # dir_name -> QTreeWidgetItem
+        files = {}       # rel_path -> QTreeWidgetItem
+        top_items = []   # folders + root files in entry order
+        children = {}    # dir_name -> [file items]
         first_file_item = None
 
-        _protected_files = _PROTECTED_FV_FILES
-        _protected_folders = _PROTECTED_FV_FOLDERS
-
-        def _add_delete_col(tree_item, protected=False):
-            if delete_on and not protected:
-                tree_item.setText(1, "\u2716")
-                tree_item.setForeground(1, QColor("#FF3B30"))
-
         def _ensure_folder(dir_name):
-            """Return (or create) the QTreeWidgetItem for *dir_name*."""
-            if dir_name in folders:
-                return folders[dir_name]
-            folder_item = QTreeWidgetItem(self.file_tree)
-            folder_item.setText(0, f"\U0001F4C1 {dir_name}")
-            folder_item.setFont(0, QFont("Menlo", 11, QFont.Weight.Bold))
-            folder_item.setForeground(0, QColor("#34C759"))
-            folder_item.setExpanded(True)
-            _add_delete_col(folder_item, dir_name in _protected_folders)
-            folders[dir_name] = folder_item
-            return folder_item
-
-        def _add_file(parent, file_name, rel_path):
-            nonlocal first_file_item
-            if rel_path in seen_files:
-                return
-            seen_files.add(rel_path)
-            fi = QTreeWidgetItem(parent)
-            fi.setText(0, file_name)
-            fi.setData(0, Qt.ItemDataRole.UserRole, rel_path)
-            fi.setForeground(0, QColor("#007AFF"))
-            _add_delete_col(fi, rel_path in _protected_files)
+            item = folders.get(dir_name)
+            if item is None:
+                item = folders[dir_name] = self._make_folder_item(
+                    dir_name, delete_on)
+                top_items.append(item)
+            return item
+
+        for entry in entries:
+            if entry[0] == 'dir':
+                _ensure_folder(entry[1])
+                continue
+            _, dir_name, file_name, rel_path = entry
+            fi = self._make_file_item(file_name, rel_path, delete_on)
+            files[rel_path] = fi
+            if dir_name:
+                _ensure_folder(dir_name)
+                children.setdefault(dir_name, []).append(fi)
+            else:
+                top_items.append(fi)
             if first_file_item is None:
                 first_file_item = fi
 
-        # 1) Static files from _FULL_VIEW_FILES
-        for rel_path in _FULL_VIEW_FILES:
-            full_path = os.path.join(_PKG_DIR, rel_path)
-            if not os.path.isfile(full_path):
-                continue
-            dir_name = os.path.dirname(rel_path)
-            file_name = os.path.basename(rel_path)
-            parent = _ensure_folder(dir_name) if dir_name else self.file_tree.invisibleRootItem()
-            _add_file(parent, file_name, rel_path)
-
-        # 2) Scan every subdirectory on disk (skip hidden / dunder)
-        for entry in sorted(os.listdir(_PKG_DIR)):
-            entry_path = os.path.join(_PKG_DIR, entry)
-            if not os.path.isdir(entry_path):
-                continue
-            if entry.startswith(".") or entry.startswith("__"):
-                continue
-            if any(entry.endswith(h) or entry == h
-                   for h in self._FV_HIDDEN_DIRS):
-                continue
-            parent = _ensure_folder(entry)
-            for fname in sorted(os.listdir(entry_path)):
-                fpath = os.path.join(entry_path, fname)
-                if os.path.isfile(fpath):
-                    _add_file(parent, fname, os.path.join(entry, fname))
-
-        # 3) Root-level files not in _FULL_VIEW_FILES
-        for entry in sorted(os.listdir(_PKG_DIR)):
-            entry_path = os.path.join(_PKG_DIR, entry)
-            if os.path.isfile(entry_path) and not entry.startswith("."):
-                _add_file(self.file_tree.invisibleRootItem(), entry, entry)
+        # One bulk insert per level instead of a model update per item
+        self.file_tree.addTopLevelItems(top_items)
+        for dir_name, folder_item in folders.items():
+            kids = children.get(dir_name)
+            if kids:
+                folder_item.addChildren(kids)
+            folder_item.setExpanded(True)
+
+        self._tree_folders = folders
+        self._tree_files = files
+        self._tree_delete_on = delete_on
+
+        self.file_tree.setUpdatesEnabled(True)
 
         if first_file_item:
             self.file_tree.setCurrentItem(first_file_item)
             self._on_file_tree_clicked(first_file_item, 0)
 
-        self._blocking_item_changed = False
+        del blocker
+
+    def _diff_file_tree(self, entries):
+        """Apply only the difference between *entries* and the current tree.
+
+        Watcher-triggered reloads land here: an unchanged scan is a no-op,
+        and real changes add/remove just the affected items instead of
+        clearing and rebuilding N rows.
+        """
+        delete_on = self._tree_delete_on
+        new_dirs = [e[1] for e in entries if e[0] == 'dir']
+        new_files = {e[3]: (e[1], e[2]) for e in entries if e[0] == 'file'}
+        folders, files = self._tree_folders, self._tree_files
+        if set(folders) == set(new_dirs) and files.keys() == new_files.keys():
+            return
+
+        blocker = QSignalBlocker(self.file_tree)
+        self.file_tree.setUpdatesEnabled(False)
+
+        root = self.file_tree.invisibleRootItem()
+        for rel_path in [p for p in files if p not in new_files]:
+            item = files.pop(rel_path)
+            (item.parent() or root).removeChild(item)
+        dir_set = set(new_dirs)
+        for name in [n for n in folders if n not in dir_set]:
+            item = folders.pop(name)
+            self.file_tree.takeTopLevelItem(
+                self.file_tree.indexOfTopLevelItem(item))
+        for name in new_dirs:
+            if name not in folders:
+                item = self._make_folder_item(name, delete_on)
+                folders[name] = item
+                self.file_tree.addTopLevelItem(item)
+                item.setExpanded(True)
+        for rel_path, (dir_name, file_name) in new_files.items():
+            if rel_path not in files:
+                parent = folders.get(dir_name) if dir_name else root
+                if parent is not None:
+                    fi = self._make_file_item(file_name, rel_path, delete_on)
+                    parent.addChild(fi)
+                    files[rel_path] = fi
+
+        self.file_tree.setUpdatesEnabled(True)
+        del blocker
+
+    def _watch_tree_dirs(self):
+        """Point the filesystem watcher at the root and visible folders."""
+        if self._fs_watcher is None:
+            return
+        wanted = [_PKG_DIR] + [os.path.join(_PKG_DIR, d)
+                               for d in self._tree_folders]
+        current = self._fs_watcher.directories()
+        gone = [d for d in current if d not in wanted]
+        if gone:
+            self._fs_watcher.removePaths(gone)
+        added = [d for d in wanted if d not in current]
+        if added:
+            self._fs_watcher.addPaths(added)
+
+    def _on_fs_change(self, _path):
+        self._fs_reload.start()
 
     def _on_file_tree_clicked(self, item, column):
         # Edit-mode delete via red minus column
@@ -1964,11 +2798,13 @@ class RobotControlApp(QMainWindow):
                         break
                 folder_path = os.path.join(_PKG_DIR, folder_display)
                 if os.path.isdir(folder_path):
+                    import shutil
                     shutil.rmtree(folder_path)
             else:
                 full_path = os.path.join(_PKG_DIR, rel_path)
                 if os.path.isfile(full_path):
                     os.remove(full_path)
+                self._file_cache.pop(rel_path, None)
                 if self._full_view_current_file == rel_path:
                     self._full_view_current_file = None
                     self.full_editor.clear()
@@ -1981,14 +2817,32 @@ class RobotControlApp(QMainWindow):
         # Save previously edited file
         self._save_full_view_file()
         # Load new file
-        full_path = os.path.join(_PKG_DIR, rel_path)
         self._full_view_current_file = rel_path
         try:
-            with open(full_path, "r") as f:
-                self.full_editor.setPlainText(f.read())
+            self.full_editor.setPlainText(self._read_project_file(rel_path))
         except Exception as e:
             self.full_editor.setPlainText(f"# Error loading file: {e}")
 
+    def _read_project_file(self, rel_path):
+        """Read a project file, served from a small mtime-keyed cache.
+
+        Holds the last 8 files viewed, so clicking back and forth between
+        tree items only hits the disk when a file changed underneath us.
+        """
+        full_path = os.path.join(_PKG_DIR, rel_path)
+        mtime = os.stat(full_path).st_mtime_ns
+        cached = self._file_cache.get(rel_path)
+        if cached is not None and cached[0] == mtime:
+            # Refresh recency — dicts iterate in insertion order
+            self._file_cache[rel_path] = self._file_cache.pop(rel_path)
+            return cached[1]
+        with open(full_path, "r") as f:
+            text = f.read()
+        self._file_cache[rel_path] = (mtime, text)
+        if len(self._file_cache) > 8:
+            del self._file_cache[next(iter(self._file_cache))]
+        return text
+
     def _select_file_tree_item(self, rel_path):
         """Select a file in the Full View tree by its relative path."""
         it = QTreeWidgetItemIterator(self.file_tree)
@@ -2006,8 +2860,12 @@ class RobotControlApp(QMainWindow):
             return
         full_path = os.path.join(_PKG_DIR, self._full_view_current_file)
         try:
+            text = self.full_editor.toPlainText()
             with open(full_path, "w") as f:
-                f.write(self.full_editor.toPlainText())
+                f.write(text)
+            # Prime the cache so clicking back to this file skips the read
+            self._file_cache[self._full_view_current_file] = (
+                os.stat(full_path).st_mtime_ns, text)
         except Exception:
             pass
 
@@ -2015,8 +2873,7 @@ class RobotControlApp(QMainWindow):
         """Save & Deploy triggered from Code Editor tab."""
         if self.editor_stack.currentIndex() == 0:
             # Simple View — write params + logic to movement.py before deploy
-            self._write_params_to_movement_py()
-            self._write_simple_logic_to_movement_py()
+            self._write_movement_py_from_simple_view()
         else:
             # Full View — save current file to disk first
             self._save_full_view_file()
@@ -2053,8 +2910,8 @@ class RobotControlApp(QMainWindow):
                 d for d in os.listdir(_PKG_DIR)
                 if os.path.isdir(os.path.join(_PKG_DIR, d))
                 and not d.startswith(".") and not d.startswith("__")
-                and not any(d.endswith(h) or d == h
-                            for h in self._FV_HIDDEN_DIRS)
+                and d not in _FV_HIDDEN_EXACT
+                and not d.endswith(_FV_HIDDEN_SUFFIX)
             )
             pkg_folders = sorted(disk_folders)
             if not pkg_folders:
@@ -2137,16 +2994,14 @@ class RobotControlApp(QMainWindow):
 
     def save(self):
         """Save current parameter values to the Simple View editor."""
-        self._write_params_to_movement_py()
-        self._write_simple_logic_to_movement_py()
+        self._write_movement_py_from_simple_view()
         self._log("Saved to project folder.")
         self._flash_save_buttons()
 
     def _save_from_editor(self):
         """Save triggered from Code Editor tab."""
         if self.editor_stack.currentIndex() == 0:
-            self._write_params_to_movement_py()
-            self._write_simple_logic_to_movement_py()
+            self._write_movement_py_from_simple_view()
         else:
             self._save_full_view_file()
         self._log("Saved to project folder.")
@@ -2181,32 +3036,105 @@ class RobotControlApp(QMainWindow):
             QTimer.singleShot(1500, lambda: self.editor_deploy_btn.setText("Deploy"))
 
     def check_launch_logs(self):
-        """Show recent git activity in the log."""
+        """Show recent git activity in the log (async — the UI stays live)."""
         self._log("--- Git Activity ---")
-        r = subprocess.run(
-            ["git", "log", "--oneline", "-5"],
-            cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode == 0 and r.stdout.strip():
-            for line in r.stdout.strip().splitlines():
+        self._run_git_async(["log", "--oneline", "-5"], self._on_git_log_done)
+
+    def _github_request_async(self, url, token, on_done, payload=None):
+        """GET — or POST, when *payload* is given — a GitHub API URL
+        without blocking the GUI thread.
+
+        on_done(status, body_bytes) is called on the GUI thread when the
+        reply finishes; status is 0 for transport-level failures, with
+        the error string as the body.
+        """
+        from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+        if self._net_manager is None:
+            # One manager for the app so keep-alive connections are
+            # reused across requests
+            self._net_manager = QNetworkAccessManager(self)
+        req = QNetworkRequest(QUrl(url))
+        for name, value in _HTTP_HEADERS.items():
+            req.setRawHeader(name.encode(), value.encode())
+        req.setRawHeader(b"Authorization", f"token {token}".encode())
+        if payload is None:
+            reply = self._net_manager.get(req)
+        else:
+            req.setRawHeader(b"Content-Type", b"application/json")
+            reply = self._net_manager.post(req, payload)
+
+        def _finished():
+            status = int(reply.attribute(
+                QNetworkRequest.Attribute.HttpStatusCodeAttribute) or 0)
+            body = bytes(reply.readAll())
+            if status == 0 and not body:
+                body = reply.errorString().encode()
+            reply.deleteLater()
+            on_done(status, body)
+
+        reply.finished.connect(_finished)
+
+    def _start_git_pipeline(self, pipe, on_finished=None):
+        """Start a _GitPipeline, holding a reference so runs don't overlap."""
+        def _done(ok):
+            self._git_pipeline = None
+            if on_finished is not None:
+                on_finished(ok)
+
+        self._git_pipeline = pipe
+        pipe.finished.connect(_done)
+        pipe.start()
+
+    def _run_git_async(self, args, on_done):
+        """Run git via QProcess; call on_done(exit_code, stdout, stderr)."""
+        proc = QProcess(self)
+        proc.setProgram("git")
+        proc.setArguments(args)
+        proc.setWorkingDirectory(_PKG_DIR)
+
+        def _finished(code, _status):
+            out = bytes(proc.readAllStandardOutput()).decode(errors="replace")
+            err = bytes(proc.readAllStandardError()).decode(errors="replace")
+            proc.deleteLater()
+            on_done(code, out, err)
+
+        proc.finished.connect(_finished)
+        proc.start()
+
+    def _on_git_log_done(self, code, out, err):
+        if code == 0 and out.strip():
+            for line in out.strip().splitlines():
                 self._log(f"  {line}")
         else:
             self._log("  No commits yet" + (
-                f": {r.stderr.strip()}" if r.stderr.strip() else ""))
-        r = subprocess.run(
-            ["git", "status", "--short"],
-            cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode == 0:
-            status_out = r.stdout.strip()
+                f": {err.strip()}" if err.strip() else ""))
+        self._run_git_async(["status", "--short"], self._on_git_status_done)
+
+    def _on_git_status_done(self, code, out, err):
+        if code == 0:
+            status_out = out.strip()
             self._log(f"  git status: "
                       f"{status_out if status_out else 'clean (nothing to commit)'}")
         else:
-            self._log(f"  git status error: {r.stderr.strip()}")
+            self._log(f"  git status error: {err.strip()}")
 
     def _find_conda_env(self):
         """Locate the conda 'ros_env' environment.
 
-        Returns (conda_prefix, error_message). On success error_message is None.
+        Returns (conda_prefix, error_message). On success error_message is
+        None. A successful lookup is cached for the session — the PATH walk
+        plus `conda env list` costs hundreds of ms and the env location
+        doesn't move while the app runs.
         """
+        if self._conda_env_cache is not None:
+            return self._conda_env_cache
+        result = self._find_conda_env_uncached()
+        if result[1] is None:  # only cache success; errors may be transient
+            self._conda_env_cache = result
+        return result
+
+    def _find_conda_env_uncached(self):
+        import shutil
         conda_exe = shutil.which("conda")
         if conda_exe is None:
             candidates = [
@@ -2252,44 +3180,132 @@ class RobotControlApp(QMainWindow):
     # ------------------------------------------------------------------ #
 
     def _log(self, msg):
-        self.log_area.append(f"> {msg}")
-        self.log_area.verticalScrollBar().setValue(
-            self.log_area.verticalScrollBar().maximum())
+        # Buffered: bursts (arduino-cli output, git pipelines) are joined
+        # into one appendPlainText per flush instead of a relayout per line
+        self._log_buf.append(f"> {msg}")
+        if not self._log_flush.isActive():
+            self._log_flush.start()
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        text = '\n'.join(self._log_buf)
+        self._log_buf.clear()
+        # QPlainTextEdit keeps the view anchored at the bottom on append,
+        # so no manual scrollbar poke (and its extra layout pass) is needed
+        self.log_area.appendPlainText(text)
 
     # ------------------------------------------------------------------
     # USB connection
     # ------------------------------------------------------------------
 
+    def _install_usb_hotplug_hook(self):
+        """Try OS device-change notifications so idle polling can be skipped.
+
+        Returns True when a hook is active. Windows delivers WM_DEVICECHANGE
+        to the top-level window; Linux uses pyudev when available. macOS has
+        no lightweight hook, so it keeps the polling timer.
+        """
+        self._watch_devicechange = False
+        if sys.platform == "win32":
+            self._watch_devicechange = True
+            return True
+        if sys.platform.startswith("linux"):
+            try:
+                import pyudev
+            except ImportError:
+                return False
+            try:
+                ctx = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(ctx)
+                monitor.filter_by('usb')
+                self._udev_observer = pyudev.MonitorObserver(
+                    monitor, callback=lambda device: self._usb_changed.emit())
+                self._udev_observer.start()
+                return True
+            except Exception:
+                return False
+        return False
+
+    def nativeEvent(self, eventType, message):
+        """Rescan ports on WM_DEVICECHANGE (0x0219) instead of polling."""
+        if (self._watch_devicechange
+                and eventType == b"windows_generic_MSG"):
+            import ctypes.wintypes
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == 0x0219:
+                self._usb_changed.emit()
+        return super().nativeEvent(eventType, message)
+
     @staticmethod
     def _is_ch340(port_info):
         """Return True if the port belongs to a CH340 USB-serial chip (Codebot Air)."""
+        # Integer VID match settles the common case without touching the
+        # description/manufacturer strings
         return (
-            'CH340' in (port_info.description or '').upper()
+            port_info.vid in CODEBOT_VIDS
+            or 'CH340' in (port_info.description or '').upper()
             or 'CH340' in (port_info.manufacturer or '').upper()
-            or port_info.vid == 0x1A86
         )
 
     def _scan_usb_ports(self):
-        """Scan for CH340 USB serial devices and update the port combo."""
-        if not _SERIAL_AVAILABLE:
+        """Kick off a background port scan; results land in _apply_port_scan."""
+        if not _SERIAL_AVAILABLE or self._port_scanner is not None:
             return
-        all_port_infos = serial.tools.list_ports.comports()
+        if (self._arduino_proc is not None
+                and self._arduino_proc.state() != QProcess.ProcessState.NotRunning):
+            return  # arduino-cli owns the port during upload; hotplug
+                    # events during the flash are noise
+        scanner = _PortScanner()
+        scanner.signals.done.connect(self._apply_port_scan)
+        self._port_scanner = scanner
+        QThreadPool.globalInstance().start(scanner)
+
+    def _apply_port_scan(self, all_port_infos):
+        """Update the port combo from a completed scan (GUI thread)."""
+        self._port_scanner = None
         # Only show CH340 ports (Codebot Air's USB chip) to avoid clutter
         ch340_infos = [p for p in all_port_infos if self._is_ch340(p)]
-        ports = [p.device for p in ch340_infos]
 
         first_scan = self._known_ports is None
-        # Detect newly plugged-in ports
-        new_ports = [] if first_scan else [p for p in ports if p not in self._known_ports]
+        # Short-circuit when the port list is identical to the last scan —
+        # skips the combo rebuild (and its repaint) on every idle tick
+        snapshot = tuple(sorted(
+            (p.device, p.description or "", p.serial_number or "")
+            for p in ch340_infos))
+        if not first_scan and snapshot == self._port_snapshot:
+            self._pending_ports = None
+            return
+        # Debounce transitions: udev can expose the tty node before its
+        # VID/PID attributes settle, and sleep/wake can drop ports for a
+        # scan or two. Require the same changed set on a confirmation
+        # rescan ~200 ms later before connecting/disconnecting.
+        if not first_scan and snapshot != self._pending_ports:
+            self._pending_ports = snapshot
+            QTimer.singleShot(200, self._scan_usb_ports)
+            return
+        self._pending_ports = None
+        self._port_snapshot = snapshot
+        ports = [p.device for p in ch340_infos]
+
+        # Detect plugged/unplugged ports relative to the last committed set
+        old = self._known_ports or set()
+        new_ports = [] if first_scan else [p for p in ports if p not in old]
+        removed = [] if first_scan else [p for p in old if p not in ports]
         self._known_ports = set(ports)
 
-        current = self._port_combo.currentText()
-        self._port_combo.blockSignals(True)
-        self._port_combo.clear()
-        self._port_combo.addItems(ports)
-        if current in ports:
-            self._port_combo.setCurrentText(current)
-        self._port_combo.blockSignals(False)
+        combo = self._port_combo
+        if first_scan:
+            _refill(combo, ports)
+        else:
+            # Patch only the delta — removeItem/addItems keep the current
+            # selection and model indexes intact, unlike a clear+refill
+            with QSignalBlocker(combo):
+                for p in removed:
+                    idx = combo.findText(p)
+                    if idx >= 0:
+                        combo.removeItem(idx)
+                combo.addItems(new_ports)
         has_ports = len(ports) > 0
         # Only enable Connect if not already connected
         if self._serial_conn is None or not self._serial_conn.is_open:
@@ -2306,11 +3322,12 @@ class RobotControlApp(QMainWindow):
             self._usb_port = None
             self.connect_btn.setText("Connect")
             self.conn_status.setText("Not connected")
-            self.conn_status.setStyleSheet("color: #FF3B30; font-weight: bold; padding-left: 8px;")
+            self._set_conn_state("disconnected")
             self.run_btn.setEnabled(False)
             self.stop_btn.setEnabled(False)
             self.deploy_btn.setEnabled(False)
-            self.editor_deploy_btn.setEnabled(False)
+            if hasattr(self, 'editor_deploy_btn'):
+                self.editor_deploy_btn.setEnabled(False)
             self._log("USB: Codebot Air disconnected.")
 
         # Auto-connect when a CH340 port appears (including on first scan if already plugged in)
@@ -2319,8 +3336,24 @@ class RobotControlApp(QMainWindow):
             self._port_combo.setCurrentText(auto_candidates[0])
             self._do_usb_connect()
 
+    def _set_conn_state(self, state):
+        """Flip the status label colour via its 'state' dynamic property."""
+        self.conn_status.setProperty("state", state)
+        style = self.conn_status.style()
+        style.unpolish(self.conn_status)
+        style.polish(self.conn_status)
+
     def _do_usb_connect(self):
         """Connect to or disconnect from the selected USB port."""
+        if self._connecting:
+            return  # re-entry guard: a scan can fire while a dialog is up
+        self._connecting = True
+        try:
+            self._do_usb_connect_impl()
+        finally:
+            self._connecting = False
+
+    def _do_usb_connect_impl(self):
         if self._serial_conn and self._serial_conn.is_open:
             # Disconnect
             try:
@@ -2331,11 +3364,12 @@ class RobotControlApp(QMainWindow):
             self._usb_port = None
             self.connect_btn.setText("Connect")
             self.conn_status.setText("Not connected")
-            self.conn_status.setStyleSheet("color: #FF3B30; font-weight: bold; padding-left: 8px;")
+            self._set_conn_state("disconnected")
             self.run_btn.setEnabled(False)
             self.stop_btn.setEnabled(False)
             self.deploy_btn.setEnabled(False)
-            self.editor_deploy_btn.setEnabled(False)
+            if hasattr(self, 'editor_deploy_btn'):
+                self.editor_deploy_btn.setEnabled(False)
             self._log("USB: Disconnected.")
             return
 
@@ -2348,19 +3382,32 @@ class RobotControlApp(QMainWindow):
                                 "Install pyserial:  pip install pyserial")
             return
         try:
-            self._serial_conn = serial.Serial(port, CODEBOT_BAUD, timeout=2)
+            # write_timeout bounds worker-thread writes too — a wedged
+            # CH340 fails the write instead of hanging the writer forever.
+            # Short read timeout keeps any future read loop interleaving
+            # with the event loop; exclusive stops another process from
+            # grabbing the port mid-session (POSIX; a no-op on Windows,
+            # where ports are always exclusive)
+            self._serial_conn = serial.Serial(
+                port, CODEBOT_BAUD, timeout=0.2, write_timeout=0.5,
+                exclusive=True)
             self._usb_port = port
             self.connect_btn.setText("Disconnect")
             self.conn_status.setText(f"Connected — {port}")
-            self.conn_status.setStyleSheet("color: #34C759; font-weight: bold; padding-left: 8px;")
+            self._set_conn_state("connected")
             self.run_btn.setEnabled(True)
             self.stop_btn.setEnabled(True)
             self.deploy_btn.setEnabled(True)
-            self.editor_deploy_btn.setEnabled(True)
+            if hasattr(self, 'editor_deploy_btn'):
+                self.editor_deploy_btn.setEnabled(True)
             self._log(f"USB: Connected to {port} at {CODEBOT_BAUD} baud.")
         except Exception as e:
-            QMessageBox.critical(self, "Connection Failed", str(e))
-            self._log(f"USB ERROR: {e}")
+            msg = str(e)
+            if "exclusively lock" in msg:
+                msg = (f"{port} is in use by another program "
+                       "(serial monitor, RoboSim, another instance?).")
+            QMessageBox.critical(self, "Connection Failed", msg)
+            self._log(f"USB ERROR: {msg}")
 
     # ------------------------------------------------------------------
     # Run / Stop
@@ -2368,52 +3415,129 @@ class RobotControlApp(QMainWindow):
 
     def _run_code(self):
         """Compile and upload the current sketch to Codebot Air via arduino-cli."""
+        if (self._arduino_proc is not None
+                and self._arduino_proc.state() != QProcess.ProcessState.NotRunning):
+            self._log("Run: an upload is already in progress.")
+            return
         sketch_dir = _PKG_DIR
         port = self._usb_port or (self._port_combo.currentText())
         if not port:
             QMessageBox.warning(self, "No Port", "Connect Codebot Air via USB-C first.")
             return
         self._log(f"Run: compiling and uploading sketch to {port}...")
-        try:
-            proc = subprocess.Popen(
-                [ARDUINO_CLI, "compile", "--upload", "-p", port, "--fqbn", CODEBOT_FQBN, sketch_dir],
-                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
-            )
-            for line in proc.stdout:
-                self._log(line.rstrip())
-            proc.wait()
-            if proc.returncode == 0:
-                self._log("Run: Upload successful.")
+        # QProcess keeps the GUI live during the compile — output lines
+        # arrive as readyRead signals instead of a blocking stdout loop
+        # Reuse the cached binary when sources are unchanged — upload-only
+        # skips the compile that dominates the Run button's wall time
+        args = ["compile", "--upload", "-p", port, "--fqbn", CODEBOT_FQBN, sketch_dir]
+        digest = _sketch_hash()
+        if digest:
+            cache_dir = os.path.join(_BIN_CACHE_DIR, digest)
+            try:
+                cached = any(n.endswith(('.bin', '.hex'))
+                             for n in os.listdir(cache_dir))
+            except OSError:
+                cached = False
+            if cached:
+                self._log("Run: sources unchanged — uploading cached build.")
+                args = ["upload", "-p", port, "--fqbn", CODEBOT_FQBN,
+                        "--input-dir", cache_dir, sketch_dir]
             else:
-                self._log(f"Run: Upload failed (exit {proc.returncode}).")
-        except FileNotFoundError:
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    args = ["compile", "--upload", "-p", port, "--fqbn", CODEBOT_FQBN,
+                            "--output-dir", cache_dir, sketch_dir]
+                except OSError:
+                    pass  # cache unavailable — plain compile+upload
+        proc = QProcess(self)
+        proc.setProgram(ARDUINO_CLI)
+        proc.setArguments(args)
+        proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        proc.readyReadStandardOutput.connect(self._on_arduino_output)
+        proc.finished.connect(self._on_arduino_finished)
+        proc.errorOccurred.connect(self._on_arduino_error)
+        self._arduino_proc = proc
+        self.run_btn.setEnabled(False)
+        # arduino-cli holds the port exclusively during upload — pause
+        # scanning so a transient port disappearance can't trip the
+        # auto-disconnect branch mid-flash
+        self._usb_poll_paused = self._usb_timer.isActive()
+        self._usb_timer.stop()
+        proc.start()
+
+    def _on_arduino_output(self):
+        out = bytes(self._arduino_proc.readAllStandardOutput()).decode(errors='replace')
+        for line in out.splitlines():
+            self._log(line.rstrip())
+
+    def _on_arduino_finished(self, rc, _status):
+        if rc == 0:
+            self._log("Run: Upload successful.")
+        else:
+            self._log(f"Run: Upload failed (exit {rc}).")
+        self._after_arduino()
+
+    def _on_arduino_error(self, err):
+        if err == QProcess.ProcessError.FailedToStart:
             self._log("ERROR: arduino-cli not found. Install it from https://arduino.github.io/arduino-cli/")
-        except Exception as e:
-            self._log(f"Run ERROR: {e}")
+        else:
+            self._log(f"Run ERROR: {err.name}")
+        self._after_arduino()
+
+    def _after_arduino(self):
+        self.run_btn.setEnabled(self._serial_conn is not None and self._serial_conn.is_open)
+        if self._usb_poll_paused:
+            self._usb_poll_paused = False
+            self._usb_timer.start()
 
     def _stop_robot(self):
         """Send a stop command to Codebot Air over the serial connection."""
         if self._serial_conn and self._serial_conn.is_open:
-            try:
-                self._serial_conn.write(b"STOP\n")
-                self._log("Stop command sent to Codebot Air.")
-            except Exception as e:
-                self._log(f"Stop ERROR: {e}")
+            self._serial_write(b"STOP\n", "Stop command sent to Codebot Air.")
         else:
             self._log("Stop: no active USB connection.")
 
+    def _serial_write(self, payload, done_msg):
+        """Queue a write on the serial worker thread (started on first use)."""
+        if self._serial_writer is None:
+            self._serial_writer_thread = QThread(self)
+            self._serial_writer = _SerialWriter()
+            self._serial_writer.moveToThread(self._serial_writer_thread)
+            self._serial_writer.wrote.connect(self._log)
+            self._serial_writer.failed.connect(self._log)
+            self._serial_writer_thread.start()
+        self._serial_writer.submit.emit(self._serial_conn, payload, done_msg)
+
     def _save_log_for_logbook(self, logbook_folder):
         """Write the current log window content to .testdrive_log.txt in logbook_folder."""
+        self._flush_log()  # pick up lines still waiting in the append buffer
         try:
+            import tempfile
             log_path = os.path.join(logbook_folder, ".testdrive_log.txt")
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write(self.log_area.toPlainText())
+            # Stream block by block: toPlainText() would duplicate the
+            # whole log as one string before a single big write
+            fd, tmp_path = tempfile.mkstemp(
+                dir=logbook_folder, prefix=".testdrive_log.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                block = self.log_area.document().firstBlock()
+                while block.isValid():
+                    f.write(block.text())
+                    f.write("\n")
+                    block = block.next()
+            os.replace(tmp_path, log_path)
         except Exception:
             pass
 
     def closeEvent(self, event):
         """Clean up serial connection and save Logbook log on window close."""
+        self._autosave()  # flush any pending debounced save
         self._usb_timer.stop()
+        observer = getattr(self, "_udev_observer", None)
+        if observer is not None:
+            observer.stop()
+        if self._serial_writer_thread is not None:
+            self._serial_writer_thread.quit()
+            self._serial_writer_thread.wait(1000)
         if self._serial_conn and self._serial_conn.is_open:
             try:
                 self._serial_conn.close()
@@ -2430,33 +3554,49 @@ class RobotControlApp(QMainWindow):
     # ------------------------------------------------------------------
 
     def _load_git_creds(self):
-        """Load saved git credentials from disk."""
-        try:
-            with open(_GIT_CREDS_FILE, "r") as fh:
-                return json.load(fh)
-        except Exception:
-            return {}
+        """Load saved git credentials (cached after the first disk read)."""
+        if self._git_creds_cache is None:
+            try:
+                with open(_GIT_CREDS_FILE, "r") as fh:
+                    self._git_creds_cache = json.load(fh)
+            except Exception:
+                self._git_creds_cache = {}
+        return self._git_creds_cache
 
     def _save_git_creds(self, creds: dict):
         """Persist git credentials (username, token, repo_name) to disk."""
         try:
             existing = self._load_git_creds()
+            if all(existing.get(k) == v for k, v in creds.items()):
+                return  # nothing changed — skip the rewrite
             existing.update(creds)
-            with open(_GIT_CREDS_FILE, "w") as fh:
-                json.dump(existing, fh, indent=2)
+            # Atomic replace so a crash mid-write can't corrupt the file
+            import tempfile
+            fd, tmp_path = tempfile.mkstemp(
+                dir=_PKG_DIR, prefix=".git_credentials.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as fh:
+                    json.dump(existing, fh, indent=2)
+                    fh.flush()
+                    os.fsync(fd)
+                os.replace(tmp_path, _GIT_CREDS_FILE)
+            except Exception:
+                # Never leave a token-bearing temp file where the push
+                # pipeline's `git add .` would sweep it up
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # Owner-only: the file holds a GitHub token
+            os.chmod(_GIT_CREDS_FILE, 0o600)
         except Exception:
             pass
 
     def _show_git_menu(self):
         """Show the Git action dropdown beneath the GitHub button."""
         menu = QMenu(self)
-        menu.setStyleSheet(
-            "QMenu { background: white; border: 1px solid #ddd; border-radius: 8px; "
-            "padding: 4px 0; font-size: 13px; }"
-            "QMenu::item { padding: 8px 24px; color: #1a1a1a; }"
-            "QMenu::item:selected { background: #F0F0F0; color: #1a1a1a; border-radius: 4px; }"
-            "QMenu::separator { height: 1px; background: #eee; margin: 4px 0; }"
-        )
+        menu.setStyleSheet(_GIT_MENU_QSS)
         init_action = menu.addAction("  Create GitHub Repo")
         push_action = menu.addAction("  Commit & Push")
         pull_action = menu.addAction("  Pull from GitHub")
@@ -2492,32 +3632,28 @@ class RobotControlApp(QMainWindow):
                 "save":        True,
             })
 
-        errors = []
-
-        # 1. git init (idempotent)
-        r = subprocess.run(["git", "init"], cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode != 0:
-            errors.append(f"git init failed:\n{r.stderr.strip()}")
+        if self._git_pipeline is not None:
+            self._log("Git: another git operation is still running.")
+            return
 
-        # 2. git config author (use GitHub username)
-        subprocess.run(["git", "config", "user.name",  data["username"]], cwd=_PKG_DIR)
-        subprocess.run(["git", "config", "user.email", f"{data['username']}@users.noreply.github.com"],
-                       cwd=_PKG_DIR)
+        errors = []
 
-        # 3. Ensure .gitignore hides credential files
+        # Ensure .gitignore hides credential files
         gitignore = os.path.join(_PKG_DIR, ".gitignore")
-        hidden = {".git_credentials.json", ".robot_profiles.json", ".node_canvas.json",
-                  "__pycache__/", "*.pyc"}
         try:
-            existing_lines = open(gitignore).read().splitlines() if os.path.exists(gitignore) else []
-            with open(gitignore, "a") as fh:
-                for entry in hidden:
-                    if entry not in existing_lines:
-                        fh.write(entry + "\n")
+            if os.path.exists(gitignore):
+                with open(gitignore) as fh:
+                    existing = set(fh.read().splitlines())
+            else:
+                existing = set()
+            missing = [e for e in _GITIGNORE_ENTRIES if e not in existing]
+            if missing:
+                with open(gitignore, "a") as fh:
+                    fh.write("\n".join(missing) + "\n")
         except Exception:
             pass
 
-        # 4. Create README.md if requested
+        # Create README.md if requested
         if data["readme"]:
             readme_path = os.path.join(_PKG_DIR, "README.md")
             if not os.path.exists(readme_path):
@@ -2527,67 +3663,81 @@ class RobotControlApp(QMainWindow):
                 except Exception:
                     pass
 
-        # 5. Create GitHub repo via API
-        try:
+        pipe = _GitPipeline(self)
+        state = {"clone_url": ""}
+
+        # 1. git init (idempotent)
+        def _init_done(rc, _out, err):
+            if rc != 0:
+                errors.append(f"git init failed:\n{err.strip()}")
+
+        pipe.add(["init"], _init_done)
+
+        # 2. git config author (use GitHub username)
+        pipe.add(["config", "user.name", data["username"]])
+        pipe.add(["config", "user.email",
+                  f"{data['username']}@users.noreply.github.com"])
+
+        # 3. Create GitHub repo via API (async; pipeline resumes from the
+        # reply so the dialog's caller never blocks on the network)
+        def _repo_created(status, body):
+            if 200 <= status < 300:
+                try:
+                    state["clone_url"] = json.loads(body).get("clone_url", "")
+                except ValueError:
+                    errors.append("GitHub API error: unparsable response")
+            elif status:
+                errors.append(f"GitHub API error {status}:\n"
+                              f"{body.decode(errors='replace')[:300]}")
+            else:
+                errors.append(f"GitHub API error: {body.decode(errors='replace')}")
+            # 4. Set remote origin (embed token for auth)
+            if state["clone_url"]:
+                auth_url = state["clone_url"].replace(
+                    "https://", f"https://{data['username']}:{data['token']}@")
+                pipe.add_next(["remote", "add", "origin", auth_url])
+                pipe.add_next(["remote", "remove", "origin"])
+            pipe.resume()
+
+        def _create_repo():
             payload = json.dumps({
                 "name":        data["repo_name"],
                 "description": data["description"],
                 "private":     data["private"],
                 "auto_init":   False,
             }).encode()
-            req = urllib.request.Request(
+            self._github_request_async(
                 "https://api.github.com/user/repos",
-                data=payload,
-                headers={
-                    "Authorization": f"token {data['token']}",
-                    "Content-Type":  "application/json",
-                    "Accept":        "application/vnd.github+json",
-                    "User-Agent":    "TestDrive-App",
-                },
-                method="POST",
-            )
-            with urllib.request.urlopen(req) as resp:
-                repo_info = json.loads(resp.read())
-            clone_url = repo_info.get("clone_url", "")
-        except urllib.error.HTTPError as e:
-            body = e.read().decode(errors="replace")
-            errors.append(f"GitHub API error {e.code}:\n{body[:300]}")
-            clone_url = ""
-        except Exception as e:
-            errors.append(f"GitHub API error: {e}")
-            clone_url = ""
-
-        # 6. Set remote origin (embed token for auth)
-        if clone_url:
-            auth_url = clone_url.replace(
-                "https://", f"https://{data['username']}:{data['token']}@")
-            subprocess.run(["git", "remote", "remove", "origin"],
-                           cwd=_PKG_DIR, capture_output=True)
-            subprocess.run(["git", "remote", "add", "origin", auth_url],
-                           cwd=_PKG_DIR, capture_output=True)
-
-        # 7. Initial commit + push
-        subprocess.run(["git", "add", "."], cwd=_PKG_DIR, capture_output=True)
-        r = subprocess.run(["git", "commit", "-m", "Initial commit — TestDrive"],
-                           cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode != 0 and "nothing to commit" not in r.stdout:
-            errors.append(f"git commit failed:\n{r.stderr.strip()}")
-
-        if clone_url:
-            r = subprocess.run(
-                ["git", "push", "-u", "origin", "HEAD"],
-                cwd=_PKG_DIR, capture_output=True, text=True)
-            if r.returncode != 0:
-                errors.append(f"git push failed:\n{r.stderr.strip()}")
-
-        if errors:
-            QMessageBox.warning(self, "Git — Issues Encountered",
-                                "\n\n".join(errors))
-        else:
-            repo_url = f"https://github.com/{data['username']}/{data['repo_name']}"
-            QMessageBox.information(
-                self, "Git — Repository Created",
-                f"Repository created and initial push complete.\n\n{repo_url}")
+                data["token"], _repo_created, payload=payload)
+            return _GitPipeline.PAUSE
+
+        pipe.add_call(_create_repo)
+
+        # 5. Initial commit + push
+        def _commit_done(rc, out, err):
+            if rc != 0 and "nothing to commit" not in out:
+                errors.append(f"git commit failed:\n{err.strip()}")
+            if state["clone_url"]:
+                pipe.add_next(["push", "-u", "origin", "HEAD"], _push_done)
+
+        def _push_done(rc, _out, err):
+            if rc != 0:
+                errors.append(f"git push failed:\n{err.strip()}")
+
+        pipe.add(["add", "."])
+        pipe.add(["commit", "-m", "Initial commit — TestDrive"], _commit_done)
+
+        def _report(_ok):
+            if errors:
+                QMessageBox.warning(self, "Git — Issues Encountered",
+                                    _mask_token("\n\n".join(errors)))
+            else:
+                repo_url = f"https://github.com/{data['username']}/{data['repo_name']}"
+                QMessageBox.information(
+                    self, "Git — Repository Created",
+                    f"Repository created and initial push complete.\n\n{repo_url}")
+
+        self._start_git_pipeline(pipe, _report)
 
     # --- git commit + push ---
 
@@ -2600,14 +3750,17 @@ class RobotControlApp(QMainWindow):
 
         if data.get("save"):
             # Extract username/repo_name from URL for future pre-fill
-            m = re.match(r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$',
-                         data["repo_url"])
+            m = _GH_URL_RE.match(data["repo_url"])
             update = {"token": data["token"], "branch": data["branch"]}
             if m:
                 update["username"] = m.group(1)
                 update["repo_name"] = m.group(2)
             self._save_git_creds(update)
 
+        if self._git_pipeline is not None:
+            self._log("Git: another git operation is still running.")
+            return
+
         errors = []
         branch = data.get("branch", "main")
 
@@ -2616,113 +3769,220 @@ class RobotControlApp(QMainWindow):
         self._log(f"Branch: {branch}")
         self._log(f"Commit message: {data['message']}")
 
-        # Ensure remote is set with auth token
-        auth_url = re.sub(r'^https://',
-                          f'https://{creds.get("username", "")}:{data["token"]}@',
-                          data["repo_url"])
-        # If username not in saved creds, try extracting from URL
-        m = re.match(r'https://github\.com/([^/]+)', data["repo_url"])
-        if m:
-            auth_url = data["repo_url"].replace(
-                "https://", f"https://{m.group(1)}:{data['token']}@")
+        # Ensure remote is set with auth token; prefer the username from
+        # the URL, falling back to saved credentials
+        m = _GH_USER_RE.match(data["repo_url"])
+        user = m.group(1) if m else creds.get("username", "")
+        auth_url = data["repo_url"].replace(
+            "https://", f"https://{user}:{data['token']}@")
+
+        pipe = _GitPipeline(self)
+
+        # Validate token/repo before any git step (cached 5 min) so a bad
+        # PAT fails fast instead of after the remote has been rewritten.
+        # Cache misses go through QtNetwork — only the cache hit stays
+        # synchronous, so the GUI never waits on the round-trip
+        def _check_auth():
+            meta = _cached_github_auth(data["repo_url"], data["token"])
+            if meta is not None:
+                self._log(f"Auth check: OK (default branch {meta['default_branch']})")
+                return
+            gh = _GH_URL_RE.match(data["repo_url"])
+            if not gh:
+                return  # unparsable URL — let git itself report the problem
+
+            def _auth_reply(status, body):
+                if 200 <= status < 300:
+                    try:
+                        info = json.loads(body)
+                    except ValueError:
+                        info = {}
+                    meta = _store_github_auth(data["repo_url"], data["token"], info)
+                    self._log(f"Auth check: OK (default branch {meta['default_branch']})")
+                    pipe.resume()
+                elif status:
+                    self._log(f"ERROR: GitHub auth check failed (HTTP {status})")
+                    QMessageBox.warning(
+                        self, "Git — Auth Failed",
+                        f"GitHub rejected the token or repository (HTTP {status}).\n"
+                        "Check the repository URL and personal access token.")
+                    pipe.abort()
+                else:
+                    # Offline — let git itself report the problem
+                    pipe.resume()
+
+            self._github_request_async(
+                f"https://api.github.com/repos/{gh.group(1)}/{gh.group(2)}",
+                data["token"], _auth_reply)
+            return _GitPipeline.PAUSE
+
+        pipe.add_call(_check_auth)
+        # The fetch (network round-trip) runs concurrently with the local
+        # add/commit steps; the pipeline joins on it before rebasing, so
+        # local disk I/O hides behind the network latency
+        fetch_state = {"done": False, "rc": 0, "err": "", "waiting": False}
+
+        def _start_fetch(rc, _out, err):
+            if rc != 0:
+                errors.append(f"git remote add failed:\n{err.strip()}")
+            fproc = QProcess(self)
+            fproc.setProgram("git")
+            fproc.setArguments(["fetch", "origin", branch])
+            fproc.setWorkingDirectory(_PKG_DIR)
+
+            def _fetch_finished(code, _status):
+                fetch_state["rc"] = code
+                fetch_state["err"] = bytes(
+                    fproc.readAllStandardError()).decode(errors="replace")
+                fetch_state["done"] = True
+                fproc.deleteLater()
+                if fetch_state["waiting"]:
+                    pipe.resume()
+
+            def _fetch_error(perr):
+                # finished never fires for FailedToStart — without this
+                # the join step would pause the pipeline forever
+                if perr != QProcess.ProcessError.FailedToStart:
+                    return
+                fetch_state["rc"] = 127
+                fetch_state["err"] = "git: failed to start"
+                fetch_state["done"] = True
+                fproc.deleteLater()
+                if fetch_state["waiting"]:
+                    pipe.resume()
+
+            fproc.finished.connect(_fetch_finished)
+            fproc.errorOccurred.connect(_fetch_error)
+            fproc.start()
+
+        pipe.add(["remote", "remove", "origin"])
+        pipe.add(["remote", "add", "origin", auth_url], _start_fetch)
+
+        def _log_output(out, err):
+            if out.strip():
+                self._log(_mask_token(out.strip()))
+            if err.strip():
+                self._log(_mask_token(err.strip()))
+
+        def _commit_done(rc, out, err):
+            _log_output(out, err)
+            if rc != 0 and "nothing to commit" not in out and "nothing to commit" not in err:
+                errors.append(f"git commit: {err.strip() or out.strip()}")
+                self._log(f"ERROR: git commit failed (exit code {rc})")
+            else:
+                self._log("git commit: OK")
 
-        subprocess.run(["git", "remote", "remove", "origin"],
-                       cwd=_PKG_DIR, capture_output=True)
-        subprocess.run(["git", "remote", "add", "origin", auth_url],
-                       cwd=_PKG_DIR, capture_output=True)
+        def _join_fetch():
+            if not fetch_state["done"]:
+                fetch_state["waiting"] = True
+                return _GitPipeline.PAUSE
 
-        self._log("Running: git add .")
-        subprocess.run(["git", "add", "."], cwd=_PKG_DIR, capture_output=True)
+        def _fetch_report():
+            if fetch_state["rc"] != 0:
+                errors.append(f"git fetch failed:\n{fetch_state['err'].strip()}")
+                self._log(f"ERROR: git fetch failed (exit code {fetch_state['rc']})")
+            else:
+                self._log("git fetch: OK")
+            self._log(f"Running: git rebase origin/{branch}")
+
+        def _rebase_done(rc, out, err):
+            _log_output(out, err)
+            if rc != 0:
+                errors.append(f"git rebase failed:\n{err.strip() or out.strip()}")
+                self._log(f"ERROR: git rebase failed (exit code {rc})")
+            else:
+                self._log("git rebase: OK")
+            self._log(f"Running: git push -u origin HEAD:{branch}")
+
+        def _push_done(rc, out, err):
+            _log_output(out, err)
+            if rc != 0:
+                errors.append(f"git push failed:\n{err.strip()}")
+                self._log(f"ERROR: git push failed (exit code {rc})")
+            else:
+                self._log("git push: OK")
 
+        self._log(f"Running: git fetch origin {branch}")
+        self._log("Running: git add .")
         self._log(f"Running: git commit -m \"{data['message']}\"")
-        r = subprocess.run(
-            ["git", "commit", "-m", data["message"]],
-            cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.stdout.strip():
-            self._log(r.stdout.strip())
-        if r.stderr.strip():
-            self._log(r.stderr.strip())
-        if r.returncode != 0 and "nothing to commit" not in r.stdout and "nothing to commit" not in r.stderr:
-            errors.append(f"git commit: {r.stderr.strip() or r.stdout.strip()}")
-            self._log(f"ERROR: git commit failed (exit code {r.returncode})")
-        else:
-            self._log("git commit: OK")
-
-        self._log(f"Running: git pull --rebase origin {branch}")
-        r = subprocess.run(
-            ["git", "pull", "--rebase", "origin", branch],
-            cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.stdout.strip():
-            self._log(r.stdout.strip())
-        if r.stderr.strip():
-            self._log(r.stderr.strip())
-        if r.returncode != 0:
-            errors.append(f"git pull --rebase failed:\n{r.stderr.strip() or r.stdout.strip()}")
-            self._log(f"ERROR: git pull --rebase failed (exit code {r.returncode})")
-        else:
-            self._log("git pull --rebase: OK")
-
-        self._log(f"Running: git push -u origin HEAD:{branch}")
-        r = subprocess.run(
-            ["git", "push", "-u", "origin", f"HEAD:{branch}"],
-            cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.stdout.strip():
-            self._log(r.stdout.strip())
-        if r.stderr.strip():
-            self._log(r.stderr.strip())
-        if r.returncode != 0:
-            errors.append(f"git push failed:\n{r.stderr.strip()}")
-            self._log(f"ERROR: git push failed (exit code {r.returncode})")
-        else:
-            self._log("git push: OK")
+        pipe.add(["add", "."])
+        pipe.add(["commit", "-m", data["message"]], _commit_done)
+        pipe.add_call(_join_fetch)
+        pipe.add_call(_fetch_report)
+        # Rebase onto the already-fetched ref — no second network call
+        # the way pull --rebase would make
+        pipe.add(["rebase", f"origin/{branch}"], _rebase_done)
+        pipe.add(["push", "-u", "origin", f"HEAD:{branch}"], _push_done)
+
+        def _report(ok):
+            if not ok:
+                # Aborted before the git steps ran (auth failure — the
+                # warning dialog has already been shown)
+                self._log("--- Push aborted ---")
+            elif errors:
+                self._log("--- Push finished with errors ---")
+                QMessageBox.warning(self, "Git — Push Issues",
+                                    _mask_token("\n\n".join(errors)))
+            else:
+                self._log("--- Push complete ---")
+                QMessageBox.information(self, "Git — Push Complete",
+                                        f"Changes pushed to:\n{data['repo_url']}")
+            if not data.get("save"):
+                # User opted out of keeping credentials for this session
+                _AUTH_CACHE.clear()
 
-        if errors:
-            self._log("--- Push finished with errors ---")
-            QMessageBox.warning(self, "Git — Push Issues", "\n\n".join(errors))
-        else:
-            self._log("--- Push complete ---")
-            QMessageBox.information(self, "Git — Push Complete",
-                                    f"Changes pushed to:\n{data['repo_url']}")
+        self._start_git_pipeline(pipe, _report)
 
     # --- git pull ---
 
     def _git_pull(self):
+        if self._git_pipeline is not None:
+            self._log("Git: another git operation is still running.")
+            return
+
         creds = self._load_git_creds()
         token = creds.get("token", "")
 
+        pipe = _GitPipeline(self)
+
         # Check we're inside a git repo
-        r = subprocess.run(["git", "rev-parse", "--is-inside-work-tree"],
-                           cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode != 0:
-            QMessageBox.warning(self, "Git — Not Initialised",
-                                "This project is not a git repository yet.\n"
-                                "Use 'Initialize & Create GitHub Repo' first.")
-            return
+        def _repo_check_done(rc, _out, _err):
+            if rc != 0:
+                QMessageBox.warning(self, "Git — Not Initialised",
+                                    "This project is not a git repository yet.\n"
+                                    "Use 'Initialize & Create GitHub Repo' first.")
+                return False
+
+        pipe.add(["rev-parse", "--is-inside-work-tree"], _repo_check_done)
 
         # Inject token into remote URL if we have one
-        if token:
-            r2 = subprocess.run(["git", "remote", "get-url", "origin"],
-                                 cwd=_PKG_DIR, capture_output=True, text=True)
-            remote_url = r2.stdout.strip()
-            if remote_url and "github.com" in remote_url:
-                m = re.match(r'https://github\.com/([^/]+)', remote_url)
+        def _remote_url_done(rc, out, _err):
+            remote_url = out.strip()
+            if rc == 0 and remote_url and "github.com" in remote_url:
+                m = _GH_USER_RE.match(remote_url)
                 if m:
                     auth_url = remote_url.replace(
                         "https://", f"https://{m.group(1)}:{token}@")
-                    subprocess.run(["git", "remote", "set-url", "origin", auth_url],
-                                   cwd=_PKG_DIR, capture_output=True)
+                    pipe.add_next(["remote", "set-url", "origin", auth_url])
 
-        r = subprocess.run(["git", "pull"],
-                           cwd=_PKG_DIR, capture_output=True, text=True)
-        if r.returncode != 0:
-            QMessageBox.warning(self, "Git — Pull Failed", r.stderr.strip())
-        else:
-            msg = r.stdout.strip() or "Already up to date."
-            QMessageBox.information(self, "Git — Pull Complete", msg)
+        if token:
+            pipe.add(["remote", "get-url", "origin"], _remote_url_done)
+
+        def _pull_done(rc, out, err):
+            if rc != 0:
+                QMessageBox.warning(self, "Git — Pull Failed",
+                                    _mask_token(err.strip()))
+            else:
+                msg = out.strip() or "Already up to date."
+                QMessageBox.information(self, "Git — Pull Complete", msg)
+
+        pipe.add(["pull"], _pull_done)
+        self._start_git_pipeline(pipe)
 
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(_QSS)
     window = RobotControlApp()
     window.show()
     sys.exit(app.exec())